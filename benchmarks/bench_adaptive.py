@@ -0,0 +1,67 @@
+"""Measures adaptive member ordering (`supportsx.set_adaptive`) on a
+skewed workload: rejecting types against `SupportsBitwiseOps` (ten
+members), where almost every rejection is caused by the same member.
+
+Run with `python benchmarks/bench_adaptive.py` (with supportsx
+installed, or with `PYTHONPATH=src`).
+
+"""
+
+import time
+
+import supportsx
+from supportsx.u import SupportsBitwiseOps
+
+_OPS = (
+    "__and__", "__lshift__", "__or__", "__rand__", "__rlshift__",
+    "__ror__", "__rrshift__", "__rshift__", "__rxor__", "__xor__",
+)
+
+
+def _types(count, missing):
+    """Create `count` types, each with a few bases, that implement
+    every bitwise operator except `missing` (for 95% of the types) or
+    a random other one.
+
+    """
+    bases = tuple(type(f"Base{i}", (), {}) for i in range(8))
+    types = []
+    for index in range(count):
+        skip = missing if index % 20 else _OPS[index % len(_OPS)]
+        namespace = {op: lambda self, other: self for op in _OPS}
+        del namespace[skip]
+        types.append(type(f"T{index}", bases, namespace))
+    return types
+
+
+def _run(types, rounds):
+    """Check each type cold `rounds` times, returning the time taken."""
+    implements = supportsx.implements
+    clear = supportsx.clear_cache
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for cls in types:
+            clear(cls)
+            implements(cls, SupportsBitwiseOps)
+    return time.perf_counter() - start
+
+
+def main():
+    types = _types(2_000, "__xor__")
+    rounds = 20
+    checks = len(types) * rounds
+    # the members are resolved in sorted order by default, so `__xor__`
+    # is resolved last
+    _run(types, 1)
+    fixed = _run(types, rounds)
+    supportsx.set_adaptive(True)
+    _run(types, 1)  # let the order adapt
+    adaptive = _run(types, rounds)
+    supportsx.set_adaptive(False)
+    print(f"fixed order:    {fixed / checks * 1e9:>8.1f} ns per check")
+    print(f"adaptive order: {adaptive / checks * 1e9:>8.1f} ns per check")
+    print(f"speedup:        {fixed / adaptive:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
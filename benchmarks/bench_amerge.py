@@ -0,0 +1,98 @@
+"""Measures the throughput and latency of `supportsx.amerge` over local
+async generators.
+
+- Throughput: sources that produce items as fast as possible, merged
+  with different buffer sizes, compared with draining the same sources
+  one after another (no merging at all).
+- Latency: sources that produce timestamped items at random intervals,
+  reporting the delay between an item being produced and the consumer
+  receiving it.
+
+Run with `python benchmarks/bench_amerge.py` (with supportsx
+installed, or with `PYTHONPATH=src`).
+
+"""
+
+import asyncio
+import random
+import statistics
+import time
+
+import supportsx
+
+
+async def _counter(count):
+    for index in range(count):
+        yield index
+
+
+async def _ticker(count, interval, rng):
+    for _ in range(count):
+        await asyncio.sleep(rng.uniform(0, 2 * interval))
+        yield time.perf_counter()
+
+
+async def _sequential(sources):
+    total = 0
+    for source in sources:
+        async for _ in source:
+            total += 1
+    return total
+
+
+async def _merged(sources, buffer):
+    total = 0
+    async for _ in supportsx.amerge(*sources, buffer=buffer):
+        total += 1
+    return total
+
+
+async def _throughput(streams, count):
+    elapsed = {}
+    start = time.perf_counter()
+    await _sequential([_counter(count) for _ in range(streams)])
+    elapsed["sequential (no merge)"] = time.perf_counter() - start
+    for buffer in (1, 16, 256):
+        start = time.perf_counter()
+        await _merged([_counter(count) for _ in range(streams)], buffer)
+        elapsed[f"amerge(buffer={buffer})"] = time.perf_counter() - start
+    return elapsed
+
+
+async def _latency(streams, count, interval, buffer):
+    rng = random.Random(0)
+    delays = []
+    sources = [_ticker(count, interval, rng) for _ in range(streams)]
+    async for produced in supportsx.amerge(*sources, buffer=buffer):
+        delays.append(time.perf_counter() - produced)
+    delays.sort()
+    return (
+        statistics.median(delays),
+        delays[int(len(delays) * 0.99)],
+    )
+
+
+def main():
+    streams, count = 8, 25_000
+    print(f"throughput: {streams} sources x {count:,} items")
+    for label, seconds in asyncio.run(_throughput(streams, count)).items():
+        rate = streams * count / seconds
+        print(f"  {label:<24} {seconds:>7.3f} s {rate:>12,.0f} items/s")
+    streams, count, interval = 32, 200, 0.001
+    print(
+        f"latency: {streams} sources x {count} items, one every"
+        f" ~{interval * 1000:g} ms per source"
+    )
+    for buffer in (1, 16, 256):
+        median, p99 = asyncio.run(
+            _latency(streams, count, interval, buffer)
+        )
+        label = f"amerge(buffer={buffer})"
+        print(
+            f"  {label:<24} p50 {median * 1e6:>7.1f} us"
+            f"   p99 {p99 * 1e6:>7.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
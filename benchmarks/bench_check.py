@@ -0,0 +1,68 @@
+"""Compares `supportsx.implements`/`supports` (a cached MRO scan) with
+the `typing` protocol checks (`issubclass`/`isinstance`).
+
+Run with `python benchmarks/bench_check.py` (with supportsx installed,
+or with `PYTHONPATH=src`).
+
+"""
+
+import timeit
+
+import supportsx
+
+
+class Deep(*(type(f"Base{i}", (), {}) for i in range(20))):
+    def __iter__(self):
+        return iter(())
+
+
+class OptedOut(Deep):
+    __iter__ = None
+
+
+def _row(label, stmt, number, namespace):
+    seconds = min(
+        timeit.repeat(stmt, number=number, repeat=5, globals=namespace)
+    )
+    print(f"{label:<40} {seconds / number * 1e9:>9.1f} ns")
+
+
+def main():
+    namespace = {
+        "implements": supportsx.implements,
+        "supports": supportsx.supports,
+        "clear": supportsx.clear_cache,
+        "add": supportsx.add,
+        "iter": supportsx.iter,
+        "Deep": Deep,
+        "OptedOut": OptedOut,
+        "obj": Deep(),
+    }
+    number = 200_000
+    print("warm (cached per type):")
+    for label, stmt in (
+        ("implements(int, add)", "implements(int, add)"),
+        ("issubclass(int, add)", "issubclass(int, add)"),
+        ("implements(Deep, iter)", "implements(Deep, iter)"),
+        ("issubclass(Deep, iter)", "issubclass(Deep, iter)"),
+        ("implements(OptedOut, iter)", "implements(OptedOut, iter)"),
+        ("issubclass(OptedOut, iter)", "issubclass(OptedOut, iter)"),
+        ("supports(Deep(), iter)", "supports(obj, iter)"),
+        ("isinstance(Deep(), iter)", "isinstance(obj, iter)"),
+    ):
+        _row(label, stmt, number, namespace)
+    # the MRO scan itself, with the cache entry of the type cleared
+    # before each check
+    number = 20_000
+    print("cold (cache cleared before each check):")
+    for label, stmt in (
+        ("implements(Deep, iter)", "clear(Deep); implements(Deep, iter)"),
+        ("implements(OptedOut, iter)",
+         "clear(OptedOut); implements(OptedOut, iter)"),
+        ("supports(Deep(), iter)", "clear(Deep); supports(obj, iter)"),
+    ):
+        _row(label, stmt, number, namespace)
+
+
+if __name__ == "__main__":
+    main()
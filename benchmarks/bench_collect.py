@@ -0,0 +1,81 @@
+"""Compares the presizing collectors (`collect_list`,
+`collect_bytearray`, and `collect_array`) with the builtin
+constructors on multi-million-item generators, which have no length
+hint of their own.
+
+For each, the number of times the storage is reallocated is counted by
+replaying the growth of the builtin (appending items one at a time and
+watching `sys.getsizeof`), next to the time taken and the peak memory
+allocated (from `tracemalloc`, which is measured in a separate run as
+it slows allocation down).
+
+Run with `python benchmarks/bench_collect.py [count]` (with supportsx
+installed, or with `PYTHONPATH=src`).
+
+"""
+
+import array
+import sys
+import time
+import tracemalloc
+
+import supportsx
+
+
+def _resizes(new, count):
+    """Count the reallocations made while growing `new()` to `count`
+    items one at a time (as the builtins do for generators).
+
+    """
+    out = new()
+    resizes = 0
+    size = sys.getsizeof(out)
+    for _ in range(count):
+        out.append(0)
+        current = sys.getsizeof(out)
+        if current != size:
+            resizes += 1
+            size = current
+    return resizes
+
+
+def _measure(collect, count):
+    """Get the time taken by, and the peak memory of, `collect(gen)`."""
+    gen = (i & 0xFF for i in range(count))
+    start = time.perf_counter()
+    collect(gen)
+    elapsed = time.perf_counter() - start
+    gen = (i & 0xFF for i in range(count))
+    tracemalloc.start()
+    collect(gen)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 4_000_000
+    cases = (
+        ("list", list, lambda gen: list(gen),
+         lambda gen: supportsx.collect_list(gen, hint=count)),
+        ("bytearray", bytearray, lambda gen: bytearray(gen),
+         lambda gen: supportsx.collect_bytearray(gen, hint=count)),
+        ("array('q')", lambda: array.array("q"),
+         lambda gen: array.array("q", gen),
+         lambda gen: supportsx.collect_array(gen, "q", hint=count)),
+    )
+    print(f"{count:,} items from a generator")
+    print(f"{'storage':<12} {'method':<10} {'resizes':>8} {'time s':>8}"
+          f" {'peak MiB':>9}")
+    for label, new, builtin, presized in cases:
+        resizes = _resizes(new, count)
+        for method, collect, grown in (
+            ("builtin", builtin, resizes), ("presized", presized, 0),
+        ):
+            elapsed, peak = _measure(collect, count)
+            print(f"{label:<12} {method:<10} {grown:>8} {elapsed:>8.3f}"
+                  f" {peak / 2 ** 20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Compares `supportsx.classify_descriptors` with classifying the
+attributes of a class by running `isinstance` against the descriptor
+protocols on each attribute.
+
+Run with `python benchmarks/bench_descriptors.py` (with supportsx
+installed, or with `PYTHONPATH=src`).
+
+"""
+
+import timeit
+
+import supportsx
+from supportsx import (
+    DescriptorKind,
+    SupportsDelete,
+    SupportsGet,
+    SupportsSet,
+)
+
+
+def _isinstance_kinds(cls):
+    """Classify the attributes of `cls` with `isinstance`."""
+    kinds = {}
+    for base in cls.__mro__:
+        for name, value in base.__dict__.items():
+            if name in kinds:
+                continue
+            if isinstance(value, (SupportsSet, SupportsDelete)):
+                kinds[name] = DescriptorKind.DATA
+            elif isinstance(value, SupportsGet):
+                kinds[name] = DescriptorKind.NON_DATA
+            else:
+                kinds[name] = DescriptorKind.VALUE
+    return kinds
+
+
+def _model(index):
+    namespace = {}
+    for attribute in range(20):
+        namespace[f"method{attribute}"] = lambda self: None
+        namespace[f"prop{attribute}"] = property(lambda self: None)
+        namespace[f"value{attribute}"] = attribute
+    return type(f"Model{index}", (), namespace)
+
+
+def main():
+    models = [_model(index) for index in range(200)]
+    assert all(
+        supportsx.classify_descriptors(model) == _isinstance_kinds(model)
+        for model in models
+    )
+    number = 5
+    for label, function in (
+        ("isinstance per attribute", _isinstance_kinds),
+        ("classify_descriptors (cold)", lambda model: (
+            supportsx.clear_cache(model),
+            supportsx.classify_descriptors(model),
+        )),
+        ("classify_descriptors (warm)", supportsx.classify_descriptors),
+    ):
+        seconds = min(timeit.repeat(
+            lambda: [function(model) for model in models],
+            number=number, repeat=5,
+        ))
+        per_class = seconds / number / len(models)
+        print(f"{label:<30} {per_class * 1e6:>9.1f} us per class")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Measures how `supportsx.parallel_check` scales with the number of
+worker processes, against a serial `supports` loop.
+
+Run with `python benchmarks/bench_parallel.py [count]` (with supportsx
+installed, or with `PYTHONPATH=src`). Workers go up to the number of
+CPUs; near-linear scaling needs as many idle cores.
+
+"""
+
+import os
+import sys
+import time
+from decimal import Decimal
+from fractions import Fraction
+
+import supportsx
+
+
+def _items(count):
+    """Generate `count` items of mixed types."""
+    kinds = (1, 1.5, "text", Decimal(1), Fraction(1, 3), None, b"x", 2)
+    for index in range(count):
+        yield kinds[index % len(kinds)]
+
+
+def _serial(count):
+    supports = supportsx.supports
+    proto = supportsx.index
+    return sum(supports(item, proto) for item in _items(count))
+
+
+def _parallel(count, workers):
+    return sum(
+        supportsx.parallel_check(
+            _items(count), supportsx.index, workers=workers,
+            chunksize=16_384,
+        )
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    cpus = os.cpu_count() or 1
+    print(f"{count:,} items, {cpus} CPU(s)")
+    start = time.perf_counter()
+    expected = _serial(count)
+    serial = time.perf_counter() - start
+    print(f"{'serial supports loop':<24} {serial:>7.2f} s")
+    workers = 1
+    while True:
+        start = time.perf_counter()
+        assert _parallel(count, workers) == expected
+        elapsed = time.perf_counter() - start
+        print(
+            f"{f'parallel_check x{workers}':<24} {elapsed:>7.2f} s"
+            f" {serial / elapsed:>6.2f}x serial"
+        )
+        if workers >= cpus:
+            break
+        workers = min(workers * 2, cpus)
+
+
+if __name__ == "__main__":
+    main()
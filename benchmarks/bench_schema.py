@@ -0,0 +1,125 @@
+"""Compares validating a large payload with a `supportsx.Schema` (both
+calling it, which stops at the first failure, and `Schema.failures`)
+with an equivalent hand-written tree of `isinstance` checks against the
+same protocols.
+
+Run with `python benchmarks/bench_schema.py` (with supportsx installed,
+or with `PYTHONPATH=src`).
+
+"""
+
+import time
+from collections.abc import Mapping, Sequence
+from decimal import Decimal
+
+import supportsx
+
+DESCRIPTION = {
+    "id": supportsx.index,
+    "name": supportsx.len,
+    "tags": [supportsx.len],
+    "points": [{"x": supportsx.float, "y": supportsx.float}],
+    "meta": {"created": supportsx.index, "weight": supportsx.float},
+}
+
+
+def _payload(records, points):
+    """Create a list of `records` records with `points` points each,
+    with mixed numeric types.
+
+    """
+    numbers = (1, 2.5, Decimal("3.5"), True)
+    return [
+        {
+            "id": index,
+            "name": f"record {index}",
+            "tags": ("a", "b", str(index)),
+            "points": [
+                {
+                    "x": numbers[i % len(numbers)],
+                    "y": numbers[(i + 1) % len(numbers)],
+                }
+                for i in range(points)
+            ],
+            "meta": {"created": index, "weight": 1.0},
+        }
+        for index in range(records)
+    ]
+
+
+def _array(value):
+    return isinstance(value, Sequence) and not isinstance(
+        value, (str, bytes, bytearray)
+    )
+
+
+def _valid(record):
+    """The equivalent of `Schema(DESCRIPTION)` for a single record."""
+    if not isinstance(record, Mapping):
+        return False
+    try:
+        id_ = record["id"]
+        name = record["name"]
+        tags = record["tags"]
+        points = record["points"]
+        meta = record["meta"]
+    except KeyError:
+        return False
+    if not (
+        isinstance(id_, supportsx.index)
+        and isinstance(name, supportsx.len)
+        and _array(tags)
+        and all(isinstance(tag, supportsx.len) for tag in tags)
+        and _array(points)
+        and isinstance(meta, Mapping)
+    ):
+        return False
+    for point in points:
+        if not isinstance(point, Mapping) or "x" not in point or (
+            "y" not in point
+        ):
+            return False
+        if not (
+            isinstance(point["x"], supportsx.float)
+            and isinstance(point["y"], supportsx.float)
+        ):
+            return False
+    return (
+        "created" in meta and "weight" in meta
+        and isinstance(meta["created"], supportsx.index)
+        and isinstance(meta["weight"], supportsx.float)
+    )
+
+
+def _time(function, payload, repeat=5):
+    """Get the best of `repeat` runs of `function(payload)`, checking
+    that it accepts `payload`.
+
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(payload)
+        best = min(best, time.perf_counter() - start)
+        assert result in (True, []), result
+    return best
+
+
+def main():
+    payload = _payload(records=2_000, points=50)
+    schema = supportsx.Schema([DESCRIPTION])
+    items = 2_000 * (50 * 3 + 9)
+    print(f"validating {len(payload)} records (~{items} values):")
+    for label, function in (
+        ("Schema(...)(payload)", schema),
+        ("Schema(...).failures(payload)", schema.failures),
+        ("isinstance tree", lambda data: _array(data) and all(
+            map(_valid, data)
+        )),
+    ):
+        seconds = _time(function, payload)
+        print(f"{label:<32} {seconds * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Compares `supportsx.SortedIndex` with keeping a plain list sorted
+(re-sorting it after each change, or with `bisect.insort`), at 1M+
+values.
+
+Run with `python benchmarks/bench_sorted.py [size]` (with supportsx
+installed, or with `PYTHONPATH=src`).
+
+"""
+
+import bisect
+import random
+import sys
+import time
+
+import supportsx
+
+
+def _time(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def _resort_adds(values, new):
+    for value in new:
+        values.append(value)
+        values.sort()
+
+
+def _insort_adds(values, new):
+    for value in new:
+        bisect.insort(values, value)
+
+
+def _index_adds(index, new):
+    for value in new:
+        index.add(value)
+
+
+def _list_removes(values, old):
+    for value in old:
+        del values[bisect.bisect_left(values, value)]
+
+
+def _index_removes(index, old):
+    for value in old:
+        index.remove(value)
+
+
+def _list_ranges(values, bounds):
+    for low, high in bounds:
+        values[
+            bisect.bisect_left(values, low):bisect.bisect_right(values, high)
+        ]
+
+
+def _index_ranges(index, bounds):
+    for low, high in bounds:
+        list(index.irange(low, high))
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    values = [rng.random() for _ in range(size)]
+    ops = 1_000
+    new = [rng.random() for _ in range(ops)]
+    old = rng.sample(values, ops)
+    bounds = [(low, low + 100 / size) for low in new]
+
+    print(f"{size:,} values, {ops:,} operations each")
+    build_list = _time(sorted, values)
+    index = supportsx.SortedIndex()
+    build_index = _time(index.update, values)
+    print(f"{'build: sorted(list)':<34} {build_list:>9.3f} s")
+    print(f"{'build: SortedIndex.update':<34} {build_index:>9.3f} s")
+
+    rows = []
+    resort = sorted(values)
+    # re-sorting is far slower, so only a tenth of the operations
+    rows.append(("add: append + list.sort", _time(
+        _resort_adds, resort, new[:ops // 10]
+    ) * 10))
+    plain = sorted(values)
+    rows.append(("add: bisect.insort", _time(_insort_adds, plain, new)))
+    rows.append(("add: SortedIndex.add", _time(_index_adds, index, new)))
+    rows.append(("remove: bisect + del", _time(_list_removes, plain, old)))
+    rows.append((
+        "remove: SortedIndex.remove", _time(_index_removes, index, old)
+    ))
+    rows.append(("range: bisect + slice", _time(
+        _list_ranges, plain, bounds
+    )))
+    rows.append(("range: SortedIndex.irange", _time(
+        _index_ranges, index, bounds
+    )))
+    for label, seconds in rows:
+        print(f"{label:<34} {seconds / ops * 1e6:>9.2f} us/op")
+    assert list(index) == plain
+
+
+if __name__ == "__main__":
+    main()
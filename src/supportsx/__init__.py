@@ -47,6 +47,9 @@ __url__ = "https://github.com/tanrbobanr/supportsx"
 __download_url__ = "https://pypi.org/project/supportsx"
 
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from ._supports import *
 from ._supports import (
     SupportsAbs as abs,
@@ -138,8 +141,111 @@ from ._supports import (
     SupportsTrunc as trunc,
     SupportsXor as xor,
 )
-from .u import *
-from . import u
+from ._check import *
+from ._reduce import *
+if TYPE_CHECKING:
+    from ._async import *
+    from ._bind import *
+    from ._buffer import *
+    from ._callables import *
+    from ._checker import *
+    from ._collect import *
+    from ._compose import *
+    from ._convert import *
+    from ._descriptors import *
+    from ._index import *
+    from ._parallel import *
+    from ._profile import *
+    from ._schema import *
+    from ._sorted import *
+    from ._trace import *
+    from ._views import *
+    from .u import *
+    from . import u
+
+
+# Names provided by the helper modules and the `u` subpackage, mapped to
+# the modules that provide them, which are only imported once one of
+# their names is first accessed (note that several builtins are shadowed
+# by protocol aliases in this module).
+_LAZY = {
+    # _async
+    "aenter_all": "._async",
+    "agather": "._async",
+    "amerge": "._async",
+    # _bind
+    "binder": "._bind",
+    # _buffer
+    "as_buffer": "._buffer",
+    "borrow_buffer": "._buffer",
+    # _callables
+    "CallKind": "._callables",
+    "call_kind": "._callables",
+    # _checker
+    "Checker": "._checker",
+    "checker": "._checker",
+    # _collect
+    "collect_array": "._collect",
+    "collect_bytearray": "._collect",
+    "collect_list": "._collect",
+    # _compose
+    "all_of": "._compose",
+    "any_of": "._compose",
+    # _convert
+    "to_array": "._convert",
+    # _descriptors
+    "DescriptorKind": "._descriptors",
+    "classify_descriptors": "._descriptors",
+    # _index
+    "implementers": "._index",
+    # _parallel
+    "parallel_check": "._parallel",
+    # _profile
+    "Profiler": "._profile",
+    # _schema
+    "Schema": "._schema",
+    # _sorted
+    "SortedIndex": "._sorted",
+    # _trace
+    "Tracer": "._trace",
+    # _views
+    "SequenceView": "._views",
+    "iter_reversed": "._views",
+    "view": "._views",
+    # u
+    "u": ".u",
+    "SupportsAsyncContextManager": ".u",
+    "SupportsBitwiseOps": ".u",
+    "SupportsComparisons": ".u",
+    "SupportsContextManager": ".u",
+    "SupportsDataDescriptor": ".u",
+    "SupportsIBitwiseOps": ".u",
+    "SupportsIMathOps": ".u",
+    "SupportsIMathOps2": ".u",
+    "SupportsItems": ".u",
+    "SupportsLength": ".u",
+    "SupportsMathFunctions": ".u",
+    "SupportsMathOps": ".u",
+    "SupportsMathOps2": ".u",
+    "SupportsTypeConversion": ".u",
+    "SupportsTypeConversion2": ".u",
+    "SupportsUnaryOps": ".u",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+    module = import_module(_LAZY[name], __name__)
+    value = module if name == "u" else vars(module)[name]
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(globals().keys() | _LAZY)
 
 
 __all__ = (
@@ -233,6 +339,71 @@ __all__ = (
     "SupportsTrunc",
     "SupportsXor",
 
+    # _async
+    "aenter_all",
+    "agather",
+    "amerge",
+
+    # _bind
+    "binder",
+
+    # _buffer
+    "as_buffer",
+    "borrow_buffer",
+
+    # _callables
+    "CallKind",
+    "call_kind",
+
+    # _check
+    "clear_cache",
+    "implements",
+    "set_adaptive",
+    "supports",
+
+    # _checker
+    "Checker",
+    "checker",
+
+    # _collect
+    "collect_array",
+    "collect_bytearray",
+    "collect_list",
+
+    # _compose
+    "all_of",
+    "any_of",
+
+    # _convert
+    "to_array",
+
+    # _descriptors
+    "DescriptorKind",
+    "classify_descriptors",
+
+    # _index
+    "implementers",
+
+    # _parallel
+    "parallel_check",
+
+    # _profile
+    "Profiler",
+
+    # _schema
+    "Schema",
+
+    # _sorted
+    "SortedIndex",
+
+    # _trace
+    "Tracer",
+
+    # _views
+    "SequenceView",
+    "iter_reversed",
+    "view",
+
     # _unions
     "SupportsAsyncContextManager",
     "SupportsBitwiseOps",
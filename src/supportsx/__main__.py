@@ -0,0 +1,78 @@
+"""Command-line interface of supportsx.
+
+Usage: `python -m supportsx profile [-m] [--sort {time,count}]
+[--limit N] target [args ...]`
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import argparse
+import os
+import runpy
+import sys
+from typing import Union
+
+from ._profile import Profiler
+
+
+def _profile(args: argparse.Namespace) -> None:
+    """Run the target of `args` under a `Profiler` and print its
+    report to stderr.
+
+    """
+    # run the target as if it were started directly (as `cProfile`
+    # does)
+    sys.argv[:] = [args.target, *args.args]
+    if not args.module:
+        sys.path.insert(0, os.path.dirname(os.path.abspath(args.target)))
+    profiler = Profiler()
+    try:
+        with profiler:
+            if args.module:
+                runpy.run_module(
+                    args.target, run_name="__main__", alter_sys=True
+                )
+            else:
+                runpy.run_path(args.target, run_name="__main__")
+    finally:
+        profiler.report(sys.stderr, sort=args.sort, limit=args.limit)
+
+
+def main(argv: Union[list[str], None] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m supportsx")
+    commands = parser.add_subparsers(dest="command", required=True)
+    profile = commands.add_parser(
+        "profile",
+        help="report the protocol checks made by a script by call site",
+    )
+    profile.add_argument(
+        "-m", dest="module", action="store_true",
+        help="run the target as a module",
+    )
+    profile.add_argument(
+        "--sort", choices=("time", "count"), default="time",
+        help="the column to sort the report by (default: time)",
+    )
+    profile.add_argument(
+        "--limit", type=int, default=None,
+        help="the maximum number of call sites to report",
+    )
+    profile.add_argument("target", help="the script (or module) to run")
+    profile.add_argument(
+        "args", nargs=argparse.REMAINDER,
+        help="the arguments passed to the target",
+    )
+    args = parser.parse_args(argv)
+    if args.command == "profile":
+        _profile(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""Concurrency helpers for objects that support the asynchronous
+protocols (`SupportsAsyncContextManager`, etc.).
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+from collections.abc import (
+    AsyncIterator,
+    Iterable,
+)
+from contextlib import (
+    AsyncExitStack,
+    asynccontextmanager,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    TypeVar,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from ._supports import (
+        SupportsAIter,
+        SupportsAwait,
+    )
+    from .u import SupportsAsyncContextManager
+
+
+__all__ = (
+    "aenter_all",
+    "agather",
+    "amerge",
+)
+
+
+_T = TypeVar("_T")
+
+# Kinds of messages sent from the sources of `amerge` to its consumer.
+_ITEM = 0
+_ERROR = 1
+_DONE = 2
+
+
+def _limiter(limit: Union[int, None]) -> Any:
+    """Get a semaphore for `limit` concurrent operations, or `None` if
+    unbounded.
+
+    """
+    if limit is None:
+        return None
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    import asyncio
+
+    return asyncio.Semaphore(limit)
+
+
+@asynccontextmanager
+async def aenter_all(
+    managers: "Iterable[SupportsAsyncContextManager[_T]]", /, *,
+    limit: Union[int, None] = None
+) -> AsyncIterator[list[_T]]:
+    """Enter all of `managers` concurrently, with at most `limit`
+    `__aenter__` calls in flight at once, and produce the list of their
+    results (in the order of `managers`).
+
+    On exit, the managers are exited one at a time in reverse order,
+    exactly as if they had been entered in order with an
+    `AsyncExitStack` (including exception propagation and
+    suppression). If any of them fails to enter (or entering is
+    cancelled), the managers still entering are cancelled, those that
+    did enter are exited in the same way, and the first failure (in the
+    order of `managers`) is raised.
+
+    """
+    import asyncio
+
+    managers = list(managers)
+    semaphore = _limiter(limit)
+
+    async def enter(manager: Any) -> Any:
+        if semaphore is None:
+            return await type(manager).__aenter__(manager)
+        async with semaphore:
+            return await type(manager).__aenter__(manager)
+
+    tasks = [asyncio.ensure_future(enter(manager)) for manager in managers]
+    async with AsyncExitStack() as stack:
+        try:
+            if tasks:
+                await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_EXCEPTION
+                )
+        finally:
+            # on failure or cancellation, stop entering and wait for the
+            # managers that are mid-entry before unwinding those that
+            # entered
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.wait(tasks)
+            for manager, task in zip(managers, tasks):
+                if not task.cancelled() and task.exception() is None:
+                    # `AsyncExitStack` accepts any object with
+                    # `__aexit__`, not only `AbstractAsyncContextManager`s
+                    stack.push_async_exit(manager)  # type: ignore[type-var]
+        for task in tasks:
+            if not task.cancelled():
+                exception = task.exception()
+                if exception is not None:
+                    raise exception
+        if any(task.cancelled() for task in tasks):
+            raise asyncio.CancelledError()
+        yield [task.result() for task in tasks]
+
+
+async def agather(
+    awaitables: "Iterable[SupportsAwait[_T]]", /, *,
+    limit: Union[int, None] = None, ordered: bool = True
+) -> AsyncIterator[_T]:
+    """Await all of `awaitables` concurrently, with at most `limit` of
+    them in flight at once, and yield their results.
+
+    Any object implementing `__await__` is accepted (not only
+    coroutines and futures). `awaitables` is consumed lazily, so large
+    (or unbounded) iterables only ever have `limit` awaitables
+    scheduled at a time. If `ordered` is `True`, results are yielded in
+    the order of `awaitables` (a slow awaitable holds back the results
+    after it); otherwise they are yielded as they complete.
+
+    The first exception raised by an awaitable is re-raised, after the
+    remaining in-flight awaitables are cancelled (as they are when the
+    iterator is closed early). Use
+    `[result async for result in agather(...)]` to collect a list.
+
+    """
+    import asyncio
+    from collections import deque
+
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be at least 1")
+    iterator = iter(awaitables)
+    # in order of scheduling if `ordered`, otherwise in no order
+    pending: Any = deque() if ordered else set()
+    add = pending.append if ordered else pending.add
+
+    def schedule() -> bool:
+        for awaitable in iterator:
+            # `ensure_future` accepts any object with `__await__`
+            future = asyncio.ensure_future(  # type: ignore[call-overload]
+                awaitable
+            )
+            add(future)
+            return True
+        return False
+
+    try:
+        while limit is None or len(pending) < limit:
+            if not schedule():
+                break
+        if ordered:
+            while pending:
+                head = pending[0]
+                while not head.done():
+                    # fail fast if a later awaitable raises first
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        if future.exception() is not None:
+                            future.result()
+                result = await head
+                pending.popleft()
+                schedule()
+                yield result
+        else:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                pending -= done
+                for _ in done:
+                    schedule()
+                for future in done:
+                    yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if pending:
+            await asyncio.wait(pending)
+
+
+async def amerge(
+    *sources: "SupportsAIter[_T]", buffer: int = 1
+) -> AsyncIterator[_T]:
+    """Merge the items of the asynchronous iterables `sources` into a
+    single asynchronous iterator, in the order in which they arrive.
+
+    Each source is drained by its own task into a queue of at most
+    `buffer` items, so sources are held back while the consumer is
+    behind. An exception raised by any source is re-raised to the
+    consumer. When the merged iterator is closed or exhausted (or
+    raises), the remaining sources are cancelled and, if they have an
+    `aclose` method (e.g. async generators), closed.
+
+    """
+    import asyncio
+
+    if buffer < 1:
+        raise ValueError("buffer must be at least 1")
+    queue: "asyncio.Queue[tuple[int, Any]]" = asyncio.Queue(buffer)
+
+    async def drain(source: Any) -> None:
+        iterator = type(source).__aiter__(source)
+        anext = type(iterator).__anext__
+        try:
+            while True:
+                try:
+                    item = await anext(iterator)
+                except StopAsyncIteration:
+                    break
+                await queue.put((_ITEM, item))
+        except Exception as exception:
+            await queue.put((_ERROR, exception))
+            return
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        await queue.put((_DONE, None))
+
+    tasks = [asyncio.ensure_future(drain(source)) for source in sources]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            kind, value = await queue.get()
+            if kind == _ITEM:
+                yield value
+            elif kind == _ERROR:
+                raise value
+            else:
+                remaining -= 1
+    finally:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
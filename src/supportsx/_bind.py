@@ -0,0 +1,143 @@
+"""Fast argument binding for objects that support `__call__`
+(`SupportsCall`).
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import keyword
+import sys
+import weakref
+from types import MethodType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+)
+
+if TYPE_CHECKING:
+    from ._supports import SupportsCall
+
+
+__all__ = (
+    "binder",
+)
+
+
+_Binder = Callable[..., dict[str, Any]]
+
+# Binders, keyed by callable (or, for bound methods, by function).
+_binders: "weakref.WeakKeyDictionary[Any, _Binder]" = (
+    weakref.WeakKeyDictionary()
+)
+_method_binders: "weakref.WeakKeyDictionary[Any, _Binder]" = (
+    weakref.WeakKeyDictionary()
+)
+# Same as `_binders`, for builtin callables that do not support weak
+# references.
+_builtin_binders: dict[Any, _Binder] = {}
+
+
+def _generate(fn: Any) -> _Binder:
+    """Generate a binder from the signature of `fn`."""
+    import inspect
+
+    parameters = []
+    names = []
+    namespace: dict[str, Any] = {}
+    previous = None
+    for index, parameter in enumerate(
+        inspect.signature(fn).parameters.values()
+    ):
+        kind = parameter.kind
+        if (
+            previous is inspect.Parameter.POSITIONAL_ONLY
+            and kind is not previous
+        ):
+            parameters.append("/")
+        if kind is inspect.Parameter.KEYWORD_ONLY and previous not in (
+            inspect.Parameter.KEYWORD_ONLY, inspect.Parameter.VAR_POSITIONAL
+        ):
+            parameters.append("*")
+        name = parameter.name
+        names.append(name)
+        if kind is inspect.Parameter.VAR_POSITIONAL:
+            parameters.append(f"*{name}")
+        elif kind is inspect.Parameter.VAR_KEYWORD:
+            parameters.append(f"**{name}")
+        elif parameter.default is inspect.Parameter.empty:
+            parameters.append(name)
+        else:
+            # defaults are bound by name, as they may not have a
+            # literal representation
+            namespace[f"_default{index}"] = parameter.default
+            parameters.append(f"{name}=_default{index}")
+        previous = kind
+    if previous is inspect.Parameter.POSITIONAL_ONLY:
+        parameters.append("/")
+    # named after `fn`, so that errors read as if `fn` had been called
+    fn_name = getattr(fn, "__name__", None)
+    if (
+        not isinstance(fn_name, str) or not fn_name.isidentifier()
+        or keyword.iskeyword(fn_name) or fn_name in names
+    ):
+        fn_name = "bind"
+    arguments = ", ".join(f"{each!r}: {each}" for each in names)
+    exec(
+        f"def {fn_name}({', '.join(parameters)}):\n"
+        f"    return {{{arguments}}}\n",
+        namespace,
+    )
+    bind = namespace[fn_name]
+    qualname = getattr(fn, "__qualname__", None)
+    if isinstance(qualname, str):
+        bind.__qualname__ = qualname
+        if sys.version_info >= (3, 11):
+            bind.__code__ = bind.__code__.replace(co_qualname=qualname)
+    return bind  # type: ignore[no-any-return]
+
+
+def binder(fn: "SupportsCall[..., Any]", /) -> _Binder:
+    """Get a function that binds arguments to the parameters of `fn`
+    (as `inspect.signature(fn).bind(...)` followed by `apply_defaults()`
+    does), returning the mapping of parameter names to values.
+
+    The signature of `fn` is analysed once, and a function with the
+    same parameters (and defaults) is generated, so arguments are bound
+    by the interpreter itself rather than by `inspect`, in a fraction
+    of the time. Arguments that `fn` would not accept raise the same
+    `TypeError` calling `fn` would. Binders are cached per function
+    object (for bound methods, per underlying function). A `ValueError`
+    is raised if the signature of `fn` cannot be determined.
+
+    """
+    if type(fn) is MethodType:
+        func = fn.__func__
+        try:
+            return _method_binders[func]
+        except KeyError:
+            bind = _method_binders[func] = _generate(fn)
+            return bind
+        except TypeError:
+            return _generate(fn)
+    try:
+        return _binders[fn]
+    except KeyError:
+        cache: Any = _binders
+    except TypeError:
+        try:
+            return _builtin_binders[fn]
+        except KeyError:
+            cache = _builtin_binders
+        except TypeError:
+            cache = None
+    bind = _generate(fn)
+    if cache is not None:
+        cache[fn] = bind
+    return bind
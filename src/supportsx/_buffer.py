@@ -0,0 +1,114 @@
+"""Zero-copy buffer acquisition for objects that support the buffer
+protocol (PEP 688).
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from ._check import (
+    _capabilities_of,
+    _has,
+)
+
+
+__all__ = (
+    "as_buffer",
+    "borrow_buffer",
+)
+
+
+# Buffer export strategies, cached per type.
+_UNSUPPORTED = 0
+_NATIVE = 1  # `memoryview(obj)`
+_DUNDER = 2  # `obj.__buffer__(flags)`
+
+# `inspect.BufferFlags.FULL_RO` (the flags `memoryview` requests)
+_FULL_RO = 0x11C
+
+
+def _strategy(obj: object) -> int:
+    """Get the buffer export strategy of the type of `obj`."""
+    cls = type(obj)
+    entry = _capabilities_of(cls)
+    strategy = entry.buffer
+    if strategy is not None:
+        return strategy
+    if _has(cls, "__buffer__"):
+        # `__buffer__` is only recognized by the interpreter on 3.12+
+        strategy = _NATIVE if sys.version_info >= (3, 12) else _DUNDER
+    else:
+        # builtin buffer types do not expose `__buffer__` before 3.12
+        try:
+            memoryview(obj).release()  # type: ignore[arg-type]
+        except TypeError:
+            strategy = _UNSUPPORTED
+        else:
+            strategy = _NATIVE
+    entry.buffer = strategy
+    return strategy
+
+
+def as_buffer(obj: object, /) -> memoryview:
+    """Get a `memoryview` of `obj` without copying it.
+
+    Works for builtin buffer types (e.g. `bytes`, `bytearray`,
+    `array.array`, `mmap.mmap`) and for objects that implement
+    `SupportsBuffer`, on every supported Python version (the interpreter
+    only recognizes `__buffer__` on 3.12+). Whether (and how) a type
+    exports buffers is cached per type.
+
+    A `TypeError` is raised if `obj` does not support the buffer
+    protocol. Use `borrow_buffer` to also release the buffer (and call
+    `__release_buffer__`) when done.
+
+    """
+    strategy = _strategy(obj)
+    if strategy == _NATIVE:
+        return memoryview(obj)  # type: ignore[arg-type]
+    if strategy == _DUNDER:
+        view = obj.__buffer__(_FULL_RO)  # type: ignore[attr-defined]
+        if not isinstance(view, memoryview):
+            raise TypeError(
+                f"{type(obj).__qualname__}.__buffer__ must return a"
+                f" memoryview, not {type(view).__qualname__}"
+            )
+        return view
+    raise TypeError(
+        f"a bytes-like object is required, not {type(obj).__qualname__!r}"
+    )
+
+
+@contextmanager
+def borrow_buffer(obj: object, /) -> Iterator[memoryview]:
+    """Borrow a `memoryview` of `obj` without copying it (see
+    `as_buffer`) for the duration of the `with` block.
+
+    On exit, the view is released and, if `obj` implements
+    `SupportsReleaseBuffer`, `__release_buffer__` is called with it
+    (which the interpreter only does by itself on 3.12+).
+
+    """
+    view = as_buffer(obj)
+    try:
+        yield view
+    finally:
+        if (
+            _strategy(obj) == _DUNDER
+            and _has(type(obj), "__release_buffer__")
+        ):
+            try:
+                obj.__release_buffer__(view)  # type: ignore[attr-defined]
+            finally:
+                view.release()
+        else:
+            view.release()
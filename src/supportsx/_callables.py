@@ -0,0 +1,119 @@
+"""Classification of objects that support `__call__` (`SupportsCall`).
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import enum
+import sys
+from functools import partial
+from types import (
+    FunctionType,
+    MethodType,
+)
+
+from ._check import (
+    _capabilities,
+    _capabilities_of,
+    _lookup,
+)
+
+
+__all__ = (
+    "CallKind",
+    "call_kind",
+)
+
+
+class CallKind(enum.IntEnum):
+    """What calling an object produces."""
+
+    NOT_CALLABLE = 0
+    """The object does not support `__call__`."""
+    SYNC = 1
+    """A plain result (e.g. functions, classes, and builtins)."""
+    GENERATOR = 2
+    """A generator (e.g. generator functions)."""
+    COROUTINE = 3
+    """A coroutine (e.g. `async def` functions, or instances of classes
+    with an `async def __call__`).
+
+    """
+    ASYNC_GENERATOR = 4
+    """An asynchronous generator (e.g. async generator functions)."""
+
+
+# `CO_GENERATOR`, `CO_COROUTINE`, and `CO_ASYNC_GENERATOR` (see
+# `inspect`), which are mutually exclusive
+_CODE_KINDS = {
+    0: CallKind.SYNC,
+    0x20: CallKind.GENERATOR,
+    0x80: CallKind.COROUTINE,
+    0x200: CallKind.ASYNC_GENERATOR,
+}
+_CODE_MASK = 0x2A0
+# whether functions may be marked with `inspect.markcoroutinefunction`
+_MARKS = sys.version_info >= (3, 12)
+
+
+def _function_kind(func: FunctionType) -> CallKind:
+    """Get the kind of a function, from the flags of its code."""
+    if _MARKS and getattr(func, "_is_coroutine_marker", None) is not None:
+        return CallKind.COROUTINE
+    return _CODE_KINDS[func.__code__.co_flags & _CODE_MASK]
+
+
+def _type_kind(cls: type) -> CallKind:
+    """Get the kind of instances of `cls` (other than functions,
+    methods, and partials), caching it per type.
+
+    """
+    entry = _capabilities_of(cls)
+    kind = entry.call
+    if kind is None:
+        method = _lookup(cls, "__call__")
+        if isinstance(method, (staticmethod, classmethod)):
+            method = method.__func__
+        if method is None:
+            kind = CallKind.NOT_CALLABLE
+        elif type(method) is FunctionType:
+            kind = _function_kind(method)
+        else:
+            kind = CallKind.SYNC
+        entry.call = kind
+    return kind
+
+
+def call_kind(obj: object, /) -> CallKind:
+    """Classify `obj` by what calling it produces.
+
+    Bound methods and `functools.partial` objects are unwrapped to the
+    function they call. Functions are classified by the flags of their
+    code objects, and other objects by the `__call__` of their type
+    (cached per type, see `clear_cache`), so instances of classes with
+    an `async def __call__` are recognized as `CallKind.COROUTINE`
+    (unlike with `inspect.iscoroutinefunction`). Classes are
+    `CallKind.SYNC`, unless their metaclass defines another kind of
+    `__call__`.
+
+    """
+    while True:
+        cls = type(obj)
+        if cls is FunctionType:
+            return _function_kind(obj)  # type: ignore[arg-type]
+        if cls is MethodType:
+            obj = obj.__func__  # type: ignore[attr-defined]
+            continue
+        # partials are never cached, as they are unwrapped first
+        entry = _capabilities.get(id(cls))
+        if entry is not None and entry.call is not None:
+            return entry.call  # type: ignore[no-any-return]
+        if not isinstance(obj, partial):
+            return _type_kind(cls)
+        obj = obj.func
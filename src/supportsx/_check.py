@@ -0,0 +1,633 @@
+"""Runtime checking of objects and types against `Supports*`
+protocols.
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import threading
+import weakref
+from typing import (
+    Any,
+    Generic,
+    Protocol,
+    TypeVar,
+    Union,
+)
+
+
+__all__ = (
+    "clear_cache",
+    "implements",
+    "set_adaptive",
+    "supports",
+)
+
+
+# Names that may appear in the namespace of a protocol but are not
+# members of it.
+_NON_MEMBERS = frozenset((
+    "__abstractmethods__",
+    "__annotate__",
+    "__annotate_func__",
+    "__annotations__",
+    "__annotations_cache__",
+    "__callable_proto_members_only__",
+    "__class_getitem__",
+    "__dict__",
+    "__doc__",
+    "__firstlineno__",
+    "__init__",
+    "__init_subclass__",
+    "__module__",
+    "__new__",
+    "__non_callable_proto_members__",
+    "__orig_bases__",
+    "__parameters__",
+    "__protocol_attrs__",
+    "__qualname__",
+    "__slots__",
+    "__static_attributes__",
+    "__subclasshook__",
+    "__type_params__",
+    "__weakref__",
+    "_abc_impl",
+    "_is_protocol",
+    "_is_runtime_protocol",
+))
+
+# Forms of overloaded members, which cannot be recovered from the
+# protocol definition at runtime (`typing.get_overloads` is only
+# available on 3.11+ and does not see through `abc.abstractmethod`).
+_OVERLOADED_FORMS: dict[str, tuple[int, ...]] = {
+    "__round__": (0, 1),
+}
+
+_P = TypeVar("_P", bound=type)
+
+_INF = float("inf")
+_REORDER_INTERVAL = 64
+# see `set_adaptive`
+_adaptive = False
+# Called instead of the implementation of `supports` and `implements`
+# (with the implementation, the object or type being checked, its type,
+# the protocol, and `strict`) while instrumentation is enabled.
+_observer: Any = None
+
+# `(min, max)` positional arities, keyed by function object.
+_arities: "weakref.WeakKeyDictionary[Any, Union[tuple[int, float], None]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Same as above, for builtin callables that do not support weak
+# references (these live as long as their types anyway).
+_builtin_arities: dict[Any, Union[tuple[int, float], None]] = {}
+# Declared forms of each member, keyed by protocol.
+_declared: dict[Any, dict[str, Union[tuple[int, ...], None]]] = {}
+# Capability bits, keyed by member name.
+_bits: dict[str, int] = {}
+# Capability cache entries, keyed by the `id` of their type.
+_capabilities: dict[int, "_Capabilities"] = {}
+# Compiled protocol information, keyed by protocol (or alias).
+_protocols: dict[Any, "_ProtocolInfo"] = {}
+# Serializes updates to the bitmasks of capability cache entries (reads
+# are not locked).
+_lock = threading.Lock()
+
+
+def _origin(proto: Any) -> type:
+    """Get the protocol class behind `proto`, which may be a
+    subscripted alias such as `SupportsAdd[Any, int]`.
+
+    """
+    if isinstance(proto, type):
+        return proto
+    origin = getattr(proto, "__origin__", None)
+    if not isinstance(origin, type):
+        raise TypeError(f"{proto!r} is not a protocol")
+    return origin
+
+
+def _members(proto: type) -> dict[str, Any]:
+    """Get the members of `proto`, mapped to their declarations."""
+    if not getattr(proto, "_is_protocol", False):
+        raise TypeError(f"{proto!r} is not a protocol")
+    members: dict[str, Any] = {}
+    for base in reversed(proto.__mro__[:-1]):
+        if base is Protocol or base is Generic:
+            continue
+        for name in getattr(base, "__annotations__", {}):
+            members.setdefault(name, None)
+        for name, value in base.__dict__.items():
+            if name not in _NON_MEMBERS:
+                members[name] = value
+    return members
+
+
+def _lookup(cls: type, name: str, default: Any = None) -> Any:
+    """Get the raw value of `name` from the first namespace in the MRO
+    of `cls` that defines it, or `default` if none do.
+
+    A member explicitly set to `None` (as is done with e.g.
+    `__hash__ = None` to opt out of a protocol) is therefore
+    indistinguishable from a missing one, unless a different `default`
+    is given. All members are looked up through here, so every check
+    treats opting out the same way on all supported Python versions.
+
+    """
+    for base in cls.__mro__:
+        namespace = base.__dict__
+        if name in namespace:
+            return namespace[name]
+    return default
+
+
+def _signature_arity(
+    func: Any, bound: int
+) -> Union[tuple[int, float], None]:
+    """Get the `(min, max)` number of positional arguments `func` can be
+    called with after its first `bound` arguments are bound, or `None`
+    if the signature cannot be determined.
+
+    """
+    import inspect
+
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        return None
+    low = 0
+    high: float = 0
+    for parameter in signature.parameters.values():
+        if parameter.kind is parameter.VAR_POSITIONAL:
+            high = _INF
+        elif parameter.kind in (
+            parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD
+        ):
+            if parameter.default is parameter.empty:
+                low += 1
+            high += 1
+        elif (
+            parameter.kind is parameter.KEYWORD_ONLY
+            and parameter.default is parameter.empty
+        ):
+            # cannot be called positionally at all
+            return (0, -1)
+    if high < bound:
+        return (0, -1)
+    return (max(low - bound, 0), high - bound)
+
+
+def _arity(raw: Any) -> Union[tuple[int, float], None]:
+    """Get the `(min, max)` number of positional arguments the class
+    attribute `raw` accepts when called through an instance, caching
+    the result per function object.
+
+    """
+    try:
+        return _arities[raw]
+    except KeyError:
+        cache: Any = _arities
+    except TypeError:
+        try:
+            return _builtin_arities[raw]
+        except KeyError:
+            cache = _builtin_arities
+        except TypeError:
+            cache = None
+    if isinstance(raw, staticmethod):
+        result = _signature_arity(raw.__func__, 0)
+    elif isinstance(raw, classmethod):
+        result = _signature_arity(raw.__func__, 1)
+    elif hasattr(type(raw), "__get__"):
+        result = _signature_arity(raw, 1)
+    else:
+        result = _signature_arity(raw, 0)
+    if cache is not None:
+        try:
+            cache[raw] = result
+        except TypeError:
+            _builtin_arities[raw] = result
+    return result
+
+
+def _declared_forms(proto: type) -> dict[str, Union[tuple[int, ...], None]]:
+    """Get the positional arities each member of `proto` must accept
+    (`None` for members that are not checked), caching the result per
+    protocol.
+
+    """
+    try:
+        return _declared[proto]
+    except KeyError:
+        pass
+    forms: dict[str, Union[tuple[int, ...], None]] = {}
+    for name, value in _members(proto).items():
+        if name in _OVERLOADED_FORMS:
+            forms[name] = _OVERLOADED_FORMS[name]
+            continue
+        if isinstance(value, property) or not callable(value):
+            forms[name] = None
+            continue
+        arity = _arity(value)
+        if arity is None or arity[1] == _INF:
+            forms[name] = None
+        else:
+            forms[name] = tuple(range(arity[0], int(arity[1]) + 1))
+    _declared[proto] = forms
+    return forms
+
+
+def _signatures_match(cls: type, proto: type) -> bool:
+    """Check that each method of `cls` accepts every form declared by
+    the corresponding member of `proto`.
+
+    """
+    for name, forms in _declared_forms(proto).items():
+        if forms is None:
+            continue
+        raw = _lookup(cls, name)
+        if raw is None:
+            return False
+        arity = _arity(raw)
+        if arity is None:
+            continue
+        low, high = arity
+        for form in forms:
+            if not low <= form <= high:
+                return False
+    return True
+
+
+def _has(cls: type, name: str) -> bool:
+    """Check whether `cls` supports `name`."""
+    return _lookup(cls, name) is not None
+
+
+def _bit(name: str) -> int:
+    """Get the capability bit assigned to `name`."""
+    try:
+        return _bits[name]
+    except KeyError:
+        bit = _bits[name] = 1 << len(_bits)
+        return bit
+
+
+class _Capabilities:
+    """The members known to be supported or unsupported by a type, as
+    bitmasks of the bits assigned by `_bit`.
+
+    """
+
+    __slots__ = (
+        "known", "present", "strict", "descriptors", "buffer",
+        "converters", "reverse", "call", "_ref",
+    )
+
+    def __init__(self, cls: type) -> None:
+        key = id(cls)
+        self.known = 0
+        self.present = 0
+        self.strict: Union[dict[type, bool], None] = None
+        self.descriptors: Any = None
+        self.buffer: Union[int, None] = None
+        self.converters: Union[dict[bool, Any], None] = None
+        self.reverse: Union[int, None] = None
+        self.call: Any = None
+        # evict the entry once `cls` is garbage collected
+        self._ref = weakref.ref(
+            cls, lambda _: _capabilities.pop(key, None)
+        )
+
+
+class _ProtocolInfo:
+    """The members of a protocol and their capability bits."""
+
+    __slots__ = (
+        "proto", "members", "mask", "data", "alternatives", "failures",
+        "rejected",
+    )
+
+    def __init__(
+        self, proto: type,
+        alternatives: "Union[tuple[_ProtocolInfo, ...], None]" = None
+    ) -> None:
+        self.proto = proto
+        # set for composites that are satisfied by any one of several
+        # protocols (see `any_of`)
+        self.alternatives = alternatives
+        self.data: frozenset[str]
+        if alternatives is not None:
+            members: dict[str, Any] = {}
+            self.data = frozenset().union(
+                *(alternative.data for alternative in alternatives)
+            )
+        else:
+            members = _members(proto)
+            self.data = frozenset(
+                name for name, value in members.items()
+                if isinstance(value, property) or not callable(value)
+            )
+        # the order in which members are resolved (see `_record_failure`)
+        self.members = tuple(
+            (name, _bit(name)) for name in sorted(members)
+        )
+        self.mask = 0
+        for _, bit in self.members:
+            self.mask |= bit
+        # rejections per member, and since the last reorder
+        self.failures: dict[str, int] = dict.fromkeys(members, 0)
+        self.rejected = 0
+
+
+def _record_failure(info: _ProtocolInfo, name: str) -> None:
+    """Record that a check against `info` was rejected by `name`.
+
+    Every `_REORDER_INTERVAL` failures, the members of `info` are
+    reordered so that those that reject most often are resolved first,
+    and the counts are halved so the order keeps following the
+    workload.
+
+    """
+    failures = info.failures
+    failures[name] += 1
+    info.rejected += 1
+    if info.rejected < _REORDER_INTERVAL:
+        return
+    info.rejected = 0
+    info.members = tuple(sorted(
+        info.members, key=lambda member: -failures[member[0]]
+    ))
+    for key in failures:
+        failures[key] //= 2
+
+
+def set_adaptive(enabled: bool = True, /) -> None:
+    """Enable or disable adaptive member ordering.
+
+    When enabled, each protocol tracks which of its members most often
+    reject a type, and resolves those first. This reduces the number of
+    lookups needed to reject types that have not yet been cached, which
+    matters most for unions with many members (e.g.
+    `SupportsBitwiseOps`) on workloads that are skewed towards
+    particular failures.
+
+    """
+    global _adaptive
+    _adaptive = enabled
+
+
+def _capabilities_of(cls: type) -> _Capabilities:
+    """Get the capability cache entry for `cls`."""
+    try:
+        return _capabilities[id(cls)]
+    except KeyError:
+        return _capabilities.setdefault(id(cls), _Capabilities(cls))
+
+
+def _resolve(entry: _Capabilities, cls: type, name: str, bit: int) -> None:
+    """Resolve whether `cls` supports `name`, recording the result in
+    its cache entry.
+
+    The lookup is made before anything is recorded, and `present` is
+    updated before `known`, so that a concurrent check never sees the
+    bit as known before its result is.
+
+    """
+    has = _has(cls, name)
+    with _lock:
+        if has:
+            entry.present |= bit
+        entry.known |= bit
+
+
+def _info(proto: Any) -> _ProtocolInfo:
+    """Get the compiled information for `proto`."""
+    try:
+        return _protocols[proto]
+    except KeyError:
+        origin = _origin(proto)
+        try:
+            info = _protocols[origin]
+        except KeyError:
+            info = _protocols[origin] = _ProtocolInfo(origin)
+        _protocols[proto] = info
+        return info
+    except TypeError:
+        # unhashable subscripted alias
+        return _info(_origin(proto))
+
+
+def _check(cls: type, info: _ProtocolInfo) -> bool:
+    """Check whether `cls` supports all members of `info`, resolving
+    only the members not already cached for `cls`.
+
+    """
+    if info.alternatives is not None:
+        return any(
+            _check(cls, alternative) for alternative in info.alternatives
+        )
+    entry = _capabilities_of(cls)
+    mask = info.mask
+    if entry.known & mask == mask:
+        return entry.present & mask == mask
+    known = entry.known
+    for name, bit in info.members:
+        if not known & bit:
+            _resolve(entry, cls, name, bit)
+        if not entry.present & bit:
+            if _adaptive:
+                _record_failure(info, name)
+            return False
+    return True
+
+
+def _check_instance(obj: object, cls: type, info: _ProtocolInfo) -> bool:
+    """Check whether `obj` supports all members of `info`, where data
+    members not supported by `cls` may instead be set on `obj` itself.
+
+    """
+    if info.alternatives is not None:
+        return any(
+            _check_instance(obj, cls, alternative)
+            for alternative in info.alternatives
+        )
+    entry = _capabilities_of(cls)
+    for name, bit in info.members:
+        if not entry.known & bit:
+            _resolve(entry, cls, name, bit)
+        if entry.present & bit:
+            continue
+        if name not in info.data or getattr(obj, name, None) is None:
+            return False
+    return True
+
+
+def _subclasshook(proto: type, other: type) -> bool:
+    """The `__subclasshook__` of protocols with data members.
+
+    `typing` refuses `issubclass` checks against such protocols, as
+    data members are usually set on instances. Those set on the class
+    itself (e.g. `__match_args__`, or the `__objclass__` slot of method
+    descriptor types) can be found in the class namespaces, so they are
+    checked there, and instance inspection is left to `isinstance`
+    only when that fails. The result is cached by both the per-type
+    capability cache and the ABC cache of `proto`.
+
+    """
+    if not isinstance(other, type):
+        raise TypeError("issubclass() arg 1 must be a class")
+    if _check(other, _info(proto)):
+        return True
+    return NotImplemented
+
+
+def _class_checkable(proto: _P) -> _P:
+    """Install `_subclasshook` as the `__subclasshook__` of the protocol
+    `proto` (which has data members), and of every protocol that
+    subclasses it without defining its own.
+
+    `typing` gives each protocol subclass a hook of its own, which
+    refuses `issubclass` checks for protocols with data members, so the
+    hook is installed again after `typing` has set up the subclass.
+
+    """
+    hook: Any = classmethod(_subclasshook)
+
+    def __init_subclass__(cls: type, *args: Any, **kwargs: Any) -> None:
+        inherited = "__subclasshook__" not in cls.__dict__
+        super(proto, cls).__init_subclass__(  # type: ignore[arg-type]
+            *args, **kwargs
+        )
+        if inherited and cls.__dict__.get("_is_protocol", False):
+            setattr(cls, "__subclasshook__", hook)
+
+    setattr(proto, "__subclasshook__", hook)
+    setattr(proto, "__init_subclass__", classmethod(__init_subclass__))
+    return proto
+
+
+def _check_strict(cls: type, info: _ProtocolInfo) -> bool:
+    """Check the signatures of `cls` against `info`, caching the result
+    per type.
+
+    """
+    if info.alternatives is not None:
+        return any(
+            _check(cls, alternative) and _check_strict(cls, alternative)
+            for alternative in info.alternatives
+        )
+    entry = _capabilities_of(cls)
+    if entry.strict is None:
+        entry.strict = {}
+    try:
+        return entry.strict[info.proto]
+    except KeyError:
+        result = entry.strict[info.proto] = _signatures_match(
+            cls, info.proto
+        )
+        return result
+
+
+def clear_cache(cls: Union[type, None] = None, /) -> None:
+    """Clear the cached capabilities of `cls`, or of all types if `cls`
+    is not given.
+
+    Capabilities are cached per type, so this must be called after
+    members are added to or removed from a type that has already been
+    checked.
+
+    """
+    if cls is None:
+        _capabilities.clear()
+    else:
+        _capabilities.pop(id(cls), None)
+
+
+# `implements` and `supports` without instrumentation (which the public
+# functions inline, as the extra call is measurable on the hot path)
+def _implements(cls: type, proto: Any, strict: bool) -> bool:
+    info = _info(proto)
+    if not _check(cls, info):
+        return False
+    return not strict or _check_strict(cls, info)
+
+
+def _supports(obj: object, proto: Any, strict: bool) -> bool:
+    info = _info(proto)
+    cls = type(obj)
+    if not _check(cls, info):
+        # data members may be set on the instance itself
+        if not info.data or not _check_instance(obj, cls, info):
+            return False
+    return not strict or _check_strict(cls, info)
+
+
+def implements(cls: type, proto: Any, /, *, strict: bool = False) -> bool:
+    """Check whether the type `cls` implements the protocol `proto`.
+
+    `proto` may also be a subscripted protocol (e.g.
+    `SupportsAdd[Any, int]`), in which case its origin is used. Members
+    explicitly set to `None` (e.g. `__hash__ = None`) are treated as
+    unsupported. Results are cached per type (see `clear_cache`).
+
+    If `strict` is `True`, the signature of each method is additionally
+    verified to accept every form declared by the protocol (e.g. both
+    `()` and `(int)` for `SupportsRound`, and both `(other)` and
+    `(other, modulo)` for `SupportsPow`). Signatures are only inspected
+    once per function object.
+
+    """
+    if _observer is not None:
+        return _observer(_implements, cls, cls, proto, strict)
+    # the cache hit path of `_info` and `_check`, inlined
+    try:
+        info = _protocols[proto]
+        entry = _capabilities[id(cls)]
+    except (KeyError, TypeError):
+        info = _info(proto)
+    else:
+        mask = info.mask
+        if (
+            entry.known & mask == mask and info.alternatives is None
+            and not strict
+        ):
+            return entry.present & mask == mask
+    if not _check(cls, info):
+        return False
+    return not strict or _check_strict(cls, info)
+
+
+def supports(obj: object, proto: Any, /, *, strict: bool = False) -> bool:
+    """Check whether `obj` supports the protocol `proto`.
+
+    See `implements` for a description of `proto` and `strict`.
+
+    """
+    if _observer is not None:
+        return _observer(_supports, obj, type(obj), proto, strict)
+    cls = type(obj)
+    # the cache hit path of `_info` and `_check`, inlined
+    try:
+        info = _protocols[proto]
+        entry = _capabilities[id(cls)]
+    except (KeyError, TypeError):
+        info = _info(proto)
+    else:
+        mask = info.mask
+        if info.alternatives is None and not strict:
+            if entry.present & mask == mask:
+                return True
+            # (data members may be set on the instance itself)
+            if entry.known & mask == mask and not info.data:
+                return False
+    if not _check(cls, info):
+        # data members may be set on the instance itself
+        if not info.data or not _check_instance(obj, cls, info):
+            return False
+    return not strict or _check_strict(cls, info)
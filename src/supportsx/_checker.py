@@ -0,0 +1,149 @@
+"""Call-site checkers with inline caching.
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import weakref
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Union,
+)
+
+from ._check import (
+    _ProtocolInfo,
+    _info,
+    supports,
+)
+
+
+__all__ = (
+    "Checker",
+    "checker",
+)
+
+
+class Checker:
+    """A callable that checks objects against a protocol at a single
+    call site (see `checker`).
+
+    """
+
+    __slots__ = (
+        "proto", "size", "strict", "megamorphic", "on_megamorphic",
+        "_cacheable", "_last", "_last_result", "_seen", "_refs",
+    )
+
+    def __init__(
+        self, proto: Any, size: int, strict: bool,
+        on_megamorphic: Union[Callable[["Checker"], None], None]
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        info: _ProtocolInfo = _info(proto)
+        self.proto = proto
+        self.size = size
+        self.strict = strict
+        # whether more than `size` types have been seen
+        self.megamorphic = False
+        self.on_megamorphic = on_megamorphic
+        # results are only determined by the type if no members may be
+        # set on instances instead
+        self._cacheable = not info.data
+        # types are cached by `id`, and held weakly (as by the global
+        # cache), so that the site does not keep them alive
+        self._last: Union[int, None] = None
+        self._last_result = False
+        self._seen: dict[int, bool] = {}
+        self._refs: dict[int, "weakref.ref[type]"] = {}
+
+    def __call__(self, obj: object, /) -> bool:
+        cls = type(obj)
+        key = id(cls)
+        if key == self._last:
+            return self._last_result
+        seen = self._seen
+        try:
+            # move the type to the end (most recently used)
+            result = seen[key] = seen.pop(key)
+        except KeyError:
+            result = supports(obj, self.proto, strict=self.strict)
+            if not self._cacheable:
+                return result
+            if len(seen) >= self.size:
+                # evict the least recently used type
+                self._forget(next(iter(seen)))
+                if not self.megamorphic:
+                    self.megamorphic = True
+                    if self.on_megamorphic is not None:
+                        self.on_megamorphic(self)
+            self._refs[key] = weakref.ref(cls, partial(self._forget, key))
+            seen[key] = result
+        self._last = key
+        self._last_result = result
+        return result
+
+    def _forget(self, key: int, ref: Any = None) -> None:
+        """Evict the type with the `id` `key`, once it is garbage
+        collected (when `ref` is called back) or when it is the least
+        recently used type at a megamorphic site.
+
+        """
+        self._seen.pop(key, None)
+        self._refs.pop(key, None)
+        if self._last == key:
+            self._last = None
+
+    @property
+    def types(self) -> tuple[type, ...]:
+        """The types cached at this site."""
+        types = (ref() for ref in self._refs.values())
+        return tuple(cls for cls in types if cls is not None)
+
+    def reset(self) -> None:
+        """Forget the types cached at this site (e.g. after
+        `clear_cache`).
+
+        """
+        self.megamorphic = False
+        self._last = None
+        self._last_result = False
+        self._seen.clear()
+        self._refs.clear()
+
+    def __repr__(self) -> str:
+        state = "megamorphic" if self.megamorphic else (
+            f"{len(self._seen)}/{self.size} types"
+        )
+        return f"<{type(self).__qualname__} {self.proto!r} ({state})>"
+
+
+def checker(
+    proto: Any, /, *, size: int = 4, strict: bool = False,
+    on_megamorphic: Union[Callable[[Checker], None], None] = None
+) -> Checker:
+    """Get a `Checker` for a single call site that checks objects
+    against `proto` (as `supports` does).
+
+    The checker remembers the results for the `size` most recently used
+    types it sees, so at monomorphic (or slightly polymorphic) sites
+    most checks are answered by an identity comparison against the last
+    type seen, or a lookup among the remembered types, rather than a
+    lookup in the global capability cache. Once more than `size` types
+    have been seen, the site is megamorphic: `Checker.megamorphic` is
+    set and `on_megamorphic` is called with the checker (once, until
+    `Checker.reset`), and each new type evicts the least recently used
+    one, so that a site whose types change over time keeps the current
+    ones. Types are remembered weakly. Results for protocols with data members (which may be set
+    on instances) are never remembered.
+
+    """
+    return Checker(proto, size, strict, on_megamorphic)
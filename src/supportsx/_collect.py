@@ -0,0 +1,184 @@
+"""Collection of iterables into presized storage, using `__len__` or
+`__length_hint__` (`SupportsLen`/`SupportsLengthHint`).
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import array
+import operator
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    TypeVar,
+    Union,
+)
+
+
+__all__ = (
+    "collect_array",
+    "collect_bytearray",
+    "collect_list",
+)
+
+
+_T = TypeVar("_T")
+
+# The number of items drained from the iterator at a time.
+_CHUNK = 1 << 16
+
+
+def _hint(iterable: Iterable[Any], hint: Union[int, None]) -> int:
+    """Get the number of items to allocate up front."""
+    if hint is not None:
+        if hint < 0:
+            raise ValueError("hint must be non-negative")
+        return hint
+    return operator.length_hint(iterable)
+
+
+def _fill(
+    out: Any, iterator: Any, size: int, chunk: Callable[[Any], Any]
+) -> int:
+    """Fill the first `size` items of `out` from `iterator`, `_CHUNK`
+    items at a time, and return the number of items filled (which is
+    less than `size` if the iterator was exhausted early).
+
+    """
+    filled = 0
+    while filled < size:
+        wanted = min(_CHUNK, size - filled)
+        part = chunk(islice(iterator, wanted))
+        count = len(part)
+        out[filled:filled + count] = part
+        filled += count
+        if count < wanted:
+            break
+    return filled
+
+
+def _chunks(
+    iterator: Any, read: Callable[[Iterable[Any]], list[Any]]
+) -> Iterator[list[Any]]:
+    """Read the rest of `iterator`, `_CHUNK` items at a time."""
+    while True:
+        part = read(islice(iterator, _CHUNK))
+        if not part:
+            return
+        yield part
+
+
+def collect_list(
+    iterable: Iterable[_T], /, *, hint: Union[int, None] = None
+) -> list[_T]:
+    """Drain `iterable` into a list that is allocated once up front.
+
+    The size is taken from `hint` if given (e.g. the length of the
+    source of a generator), or otherwise from the `__len__` or
+    `__length_hint__` of `iterable`. The hint may be wrong: the list is
+    truncated if `iterable` runs out early, and grown if it does not.
+
+    """
+    if hint is None:
+        # `list` presizes from `__len__`/`__length_hint__` by itself
+        return list(iterable)
+    size = _hint(iterable, hint)
+    iterator = iter(iterable)
+    out: list[Any] = [None] * size
+    filled = _fill(out, iterator, size, list)
+    if filled < size:
+        del out[filled:]
+    else:
+        out.extend(iterator)
+    return out
+
+
+def collect_bytearray(
+    iterable: Iterable[int], /, *, hint: Union[int, None] = None
+) -> bytearray:
+    """Drain `iterable` (of integers in `range(256)`) into a `bytearray`
+    that is allocated once up front.
+
+    The size is determined as in `collect_list`, and the hint may
+    likewise be wrong. Unlike `collect_list`, the hint is also taken
+    from `iterable` itself when not given, as `bytearray` does not
+    presize from it.
+
+    """
+    size = _hint(iterable, hint)
+    iterator = iter(iterable)
+    out = bytearray(size)
+    filled = _fill(out, iterator, size, bytes)
+    if filled < size:
+        del out[filled:]
+    else:
+        out.extend(iterator)
+    return out
+
+
+def collect_array(
+    iterable: Iterable[Any], typecode: str, /, *,
+    hint: Union[int, None] = None, numpy: bool = False
+) -> Any:
+    """Drain `iterable` into an `array.array` (or, if `numpy` is `True`,
+    a `numpy.ndarray`) with the given `typecode`, allocated once up
+    front.
+
+    The size is determined as in `collect_list`, and the hint may
+    likewise be wrong. Items are converted in chunks, so no list of the
+    whole input is ever created.
+
+    """
+    return _collect_array(iterable, typecode, hint, numpy, list)
+
+
+def _collect_array(
+    iterable: Iterable[Any], typecode: str, hint: Union[int, None],
+    numpy: bool, read: Callable[[Iterable[Any]], list[Any]]
+) -> Any:
+    """Implementation of `collect_array`, where each chunk of items is
+    turned into a list by `read` (which may also convert the items).
+
+    """
+    size = _hint(iterable, hint)
+    iterator = iter(iterable)
+    if numpy:
+        import numpy as np  # type: ignore[import-not-found]
+
+        dtype = np.dtype(typecode)
+        ndarray = np.empty(size, dtype)
+        filled = _fill(
+            ndarray, iterator, size,
+            lambda part: np.array(read(part), dtype),
+        )
+        if filled < size:
+            return ndarray[:filled].copy()
+        rest = [np.array(part, dtype) for part in _chunks(iterator, read)]
+        if rest:
+            ndarray = np.concatenate((ndarray, *rest))
+        return ndarray
+    out = array.array(typecode)
+    if size:
+        out.frombytes(bytes(out.itemsize))
+        out *= size
+    filled = _fill(
+        out, iterator, size,
+        lambda part: array.array(typecode, read(part)),
+    )
+    if filled < size:
+        del out[filled:]
+    else:
+        for part in _chunks(iterator, read):
+            out.extend(array.array(typecode, part))
+    return out
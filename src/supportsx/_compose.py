@@ -0,0 +1,213 @@
+"""Composition of `Supports*` protocols at runtime.
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import copyreg
+import threading
+import types
+from typing import (
+    Any,
+    Protocol,
+    runtime_checkable,
+)
+
+from ._check import (
+    _ProtocolInfo,
+    _info,
+    _origin,
+    _protocols,
+    implements,
+    supports,
+)
+
+
+__all__ = (
+    "all_of",
+    "any_of",
+)
+
+
+class _CompositeMeta(type):
+    """Routes `isinstance` and `issubclass` checks against composites
+    through the capability cache.
+
+    """
+
+    def __instancecheck__(cls, instance: Any) -> bool:
+        return supports(instance, cls)
+
+    def __subclasscheck__(cls, subclass: Any) -> bool:
+        if not isinstance(subclass, type):
+            raise TypeError("issubclass() arg 1 must be a class")
+        return implements(subclass, cls)
+
+
+class _AllOfMeta(_CompositeMeta, type(Protocol)):  # type: ignore[misc]
+    pass
+
+
+class _AnyOfMeta(_CompositeMeta):
+    pass
+
+
+# Composites, keyed by their kind and constituent protocols.
+_composites: dict[tuple[str, frozenset[type]], type] = {}
+_lock = threading.Lock()
+
+
+def _name(kind: str, protos: frozenset[type]) -> str:
+    """Get the name of a composite."""
+    return f"{kind}[{', '.join(sorted(p.__qualname__ for p in protos))}]"
+
+
+def all_of(*protos: Any) -> type:
+    """Get a protocol that is a union of all of `protos` (i.e. it is
+    supported by objects that support every one of `protos`), similar
+    to the union protocols in `supportsx.u`.
+
+    Subscripted protocols are accepted, but only their origins are
+    used. Identical compositions (regardless of order or duplicates)
+    return the same protocol, which is created only once, and checks
+    against it use the same capability cache as any other protocol.
+
+    """
+    if not protos:
+        raise TypeError("all_of() requires at least one protocol")
+    origins: set[type] = set()
+    for proto in protos:
+        origin = _origin(proto)
+        if isinstance(origin, _AllOfMeta):
+            # flatten nested compositions
+            origins.update(
+                base for base in origin.__bases__ if base is not Protocol
+            )
+        elif getattr(origin, "_is_protocol", False):
+            origins.add(origin)
+        else:
+            raise TypeError(f"{origin!r} is not a protocol")
+    # drop protocols that are already implied by another one
+    bases = frozenset(
+        origin for origin in origins
+        if not any(
+            other is not origin and origin in other.__mro__
+            for other in origins
+        )
+    )
+    if len(bases) == 1:
+        return next(iter(bases))
+    key = ("AllOf", bases)
+    try:
+        return _composites[key]
+    except KeyError:
+        pass
+    with _lock:
+        try:
+            return _composites[key]
+        except KeyError:
+            pass
+        name = _name("AllOf", bases)
+        composite = types.new_class(
+            name,
+            (*sorted(bases, key=lambda base: base.__qualname__), Protocol),
+            {"metaclass": _AllOfMeta},
+            lambda namespace: namespace.update({
+                "__module__": __name__,
+                "__qualname__": name,
+                "__slots__": (),
+            }),
+        )
+        composite = _composites[key] = runtime_checkable(composite)
+    return composite
+
+
+def any_of(*protos: Any) -> type:
+    """Get a composite that is supported by objects that support at
+    least one of `protos`.
+
+    The result is not a `typing.Protocol` (there is no static
+    equivalent other than `typing.Union`), but can be used with
+    `isinstance`, `issubclass`, `supports`, `implements`, and as an
+    argument to `any_of`. Subscripted protocols are accepted, but only
+    their origins are used. Identical compositions (regardless of order
+    or duplicates) return the same composite, which is created only
+    once.
+
+    """
+    if not protos:
+        raise TypeError("any_of() requires at least one protocol")
+    origins: set[type] = set()
+    for proto in protos:
+        origin = _origin(proto)
+        # flatten nested compositions
+        alternatives = getattr(origin, "__alternatives__", None)
+        if alternatives is not None:
+            origins.update(alternatives)
+        elif getattr(origin, "_is_protocol", False):
+            origins.add(origin)
+        else:
+            raise TypeError(f"{origin!r} is not a protocol")
+    bases = frozenset(origins)
+    if len(bases) == 1:
+        return next(iter(bases))
+    key = ("AnyOf", bases)
+    try:
+        return _composites[key]
+    except KeyError:
+        pass
+    with _lock:
+        try:
+            return _composites[key]
+        except KeyError:
+            pass
+        name = _name("AnyOf", bases)
+        composite = _AnyOfMeta(name, (), {
+            "__module__": __name__,
+            "__qualname__": name,
+            "__slots__": (),
+            "__alternatives__": bases,
+        })
+        _protocols[composite] = _ProtocolInfo(
+            composite,
+            tuple(_info(base) for base in sorted(
+                bases, key=lambda base: base.__qualname__
+            )),
+        )
+        _composites[key] = composite
+    return composite
+
+
+def _composite(kind: str, *bases: type) -> type:
+    """Unpickle a composite (see `_reduce_all_of` and
+    `_reduce_any_of`).
+
+    """
+    try:
+        return _composites[kind, frozenset(bases)]
+    except KeyError:
+        return (all_of if kind == "AllOf" else any_of)(*bases)
+
+
+# Composites cannot be found by name, so they are pickled as their
+# constituent protocols (and interned on load).
+def _reduce_all_of(composite: Any) -> Any:
+    return _composite, ("AllOf", *(
+        base for base in composite.__bases__ if base is not Protocol
+    ))
+
+
+def _reduce_any_of(composite: Any) -> Any:
+    return _composite, ("AnyOf", *sorted(
+        composite.__alternatives__, key=lambda base: base.__qualname__
+    ))
+
+
+copyreg.pickle(_AllOfMeta, _reduce_all_of)
+copyreg.pickle(_AnyOfMeta, _reduce_any_of)
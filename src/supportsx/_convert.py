@@ -0,0 +1,139 @@
+"""Bulk numeric conversion through `__index__`, `__int__`, and
+`__float__` (`SupportsIndex`/`SupportsInt`/`SupportsFloat`).
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import operator
+from collections.abc import Iterable
+from typing import (
+    Any,
+    Callable,
+)
+
+from ._check import (
+    _capabilities_of,
+    _check,
+    _info,
+)
+from ._collect import _collect_array
+from ._supports import (
+    SupportsFloat,
+    SupportsIndex,
+    SupportsInt,
+)
+
+
+__all__ = (
+    "to_array",
+)
+
+
+_INTEGRAL = frozenset("bBhHiIlLqQ")
+_FLOATING = frozenset("fd")
+
+_INDEX = _info(SupportsIndex)
+_INT = _info(SupportsInt)
+_FLOAT = _info(SupportsFloat)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _converter(cls: type, integral: bool) -> Callable[[Any], Any]:
+    """Get the function that converts instances of `cls` to an `int`
+    (if `integral`) or a `float`, caching it per type.
+
+    """
+    entry = _capabilities_of(cls)
+    converters = entry.converters
+    if converters is None:
+        converters = entry.converters = {}
+    try:
+        return converters[integral]
+    except KeyError:
+        pass
+    # the builtins dispatch to the same slots, but faster than calling
+    # the unbound dunders
+    converter: Callable[[Any], Any]
+    if cls is int or cls is float and not integral:
+        converter = _identity
+    elif integral:
+        # prefer the lossless conversion, as `operator.index` would
+        if _check(cls, _INDEX):
+            converter = operator.index
+        elif _check(cls, _INT):
+            converter = int
+        else:
+            raise TypeError(
+                f"{cls.__qualname__!r} object cannot be interpreted as an"
+                " integer"
+            )
+    elif _check(cls, _FLOAT) or _check(cls, _INDEX):
+        converter = float
+    else:
+        raise TypeError(
+            f"must be real number, not {cls.__qualname__!r}"
+        )
+    converters[integral] = converter
+    return converter
+
+
+def to_array(
+    values: Iterable[Any], kind: str = "d", /, *, numpy: bool = False
+) -> Any:
+    """Convert `values` into an `array.array` (or, if `numpy` is `True`,
+    a `numpy.ndarray`) of the numeric `array` typecode `kind`.
+
+    Each value is converted through `__index__` or `__int__` for
+    integral typecodes, or through `__float__` or `__index__` for
+    floating point typecodes. The conversion is chosen once per type
+    (so mixed inputs such as `int`s, `Decimal`s, and NumPy scalars are
+    supported), and the output is filled directly, in chunks, without
+    an intermediate list of the whole input (see `collect_array`).
+    Note that, as with `int`, converting through `__int__` truncates.
+
+    """
+    if kind in _INTEGRAL:
+        integral = True
+    elif kind in _FLOATING:
+        integral = False
+    else:
+        raise ValueError(f"unsupported typecode {kind!r}")
+    # per call cache, which avoids the capability cache lookup per value
+    converters: dict[type, Callable[[Any], Any]] = {}
+
+    def read(part: Iterable[Any]) -> list[Any]:
+        items = list(part)
+        kinds = set(map(type, items))
+        if len(kinds) == 1:
+            # homogeneous chunk: one converter for all of it
+            cls = kinds.pop()
+            try:
+                converter = converters[cls]
+            except KeyError:
+                converter = converters[cls] = _converter(cls, integral)
+            if converter is _identity:
+                return items
+            return list(map(converter, items))
+        converted = []
+        for value in items:
+            cls = type(value)
+            try:
+                converter = converters[cls]
+            except KeyError:
+                converter = converters[cls] = _converter(cls, integral)
+            converted.append(converter(value))
+        return converted
+
+    return _collect_array(
+        values, kind, operator.length_hint(values), numpy, read
+    )
@@ -0,0 +1,87 @@
+"""Classification of class attributes by the descriptor protocols they
+support.
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import enum
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from ._check import (
+    _capabilities_of,
+    _check,
+    _info,
+)
+from ._supports import (
+    SupportsDelete,
+    SupportsGet,
+    SupportsSet,
+)
+
+
+__all__ = (
+    "DescriptorKind",
+    "classify_descriptors",
+)
+
+
+class DescriptorKind(enum.IntEnum):
+    """The kind of a class attribute."""
+
+    VALUE = 0
+    """A plain value (does not support the descriptor protocol)."""
+    NON_DATA = 1
+    """A non-data descriptor (supports `SupportsGet` only)."""
+    DATA = 2
+    """A data descriptor (supports `SupportsSet` and/or
+    `SupportsDelete`, such as `SupportsDataDescriptor`).
+
+    """
+
+
+_GET = _info(SupportsGet)
+_SET = _info(SupportsSet)
+_DELETE = _info(SupportsDelete)
+
+
+def _kind(value: object) -> DescriptorKind:
+    """Get the kind of the class attribute `value`."""
+    cls = type(value)
+    if _check(cls, _SET) or _check(cls, _DELETE):
+        return DescriptorKind.DATA
+    if _check(cls, _GET):
+        return DescriptorKind.NON_DATA
+    return DescriptorKind.VALUE
+
+
+def classify_descriptors(cls: type, /) -> Mapping[str, DescriptorKind]:
+    """Classify every attribute in the namespaces of `cls` and its bases
+    as a plain value, a non-data descriptor, or a data descriptor.
+
+    Attributes are resolved as they would be through `cls` (i.e. the
+    first namespace in the MRO that defines a name wins). The result is
+    a read-only mapping that is computed once per class and shared
+    between calls (see `clear_cache`). Descriptor support is resolved
+    once per attribute type through the capability cache, rather than
+    through an `isinstance` check per attribute.
+
+    """
+    entry = _capabilities_of(cls)
+    descriptors = entry.descriptors
+    if descriptors is not None:
+        return descriptors
+    kinds: dict[str, DescriptorKind] = {}
+    for base in cls.__mro__:
+        for name, value in base.__dict__.items():
+            if name not in kinds:
+                kinds[name] = _kind(value)
+    descriptors = entry.descriptors = MappingProxyType(kinds)
+    return descriptors
@@ -0,0 +1,136 @@
+"""A reverse index of the loaded classes that implement a protocol.
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import sys
+import threading
+import weakref
+from collections.abc import Iterable
+from types import ModuleType
+from typing import (
+    Any,
+    Union,
+)
+
+from ._check import (
+    _check,
+    _info,
+)
+
+
+__all__ = (
+    "implementers",
+)
+
+
+# Every class discovered so far, in order of discovery (classes are
+# dropped once garbage collected).
+_classes: "weakref.WeakSet[type]" = weakref.WeakSet()
+_order: list["weakref.ref[type]"] = []
+# The names of the modules whose namespaces have been scanned.
+_scanned: set[str] = set()
+_lock = threading.Lock()
+
+
+def _discover(roots: Iterable[Any]) -> None:
+    """Add the classes among `roots`, and all of their subclasses and
+    nested classes, to the index.
+
+    """
+    stack = [root for root in roots if isinstance(root, type)]
+    while stack:
+        cls = stack.pop()
+        if cls in _classes:
+            continue
+        _classes.add(cls)
+        _order.append(weakref.ref(cls))
+        try:
+            stack.extend(type.__subclasses__(cls))
+        except TypeError:
+            pass
+        # classes defined in the class body
+        stack.extend(
+            value for value in vars(cls).values() if isinstance(value, type)
+        )
+
+
+def _refresh(names: Union[set[str], None]) -> None:
+    """Bring the index up to date with `sys.modules`.
+
+    The first refresh walks the whole subclass tree of `object`, which
+    finds every class (including those not bound to any module
+    attribute). Later refreshes only scan the direct subclasses of
+    `object` (which are cheap to diff against the index), the
+    namespaces of modules imported since the last one (and of the
+    modules in `names`, which may have gained classes since), and the
+    subclass trees and nested classes of the classes found there.
+
+    """
+    with _lock:
+        if not _order:
+            _discover((object,))
+        else:
+            _discover(
+                cls for cls in object.__subclasses__()
+                if cls not in _classes
+            )
+        for name, module in list(sys.modules.items()):
+            if name in _scanned and (names is None or name not in names):
+                continue
+            _scanned.add(name)
+            namespace = getattr(module, "__dict__", None)
+            if namespace is not None:
+                _discover(list(namespace.values()))
+        if len(_order) > 2 * len(_classes):
+            # compact the references to collected classes
+            _order[:] = [ref for ref in _order if ref() is not None]
+
+
+def implementers(
+    proto: Any, /, modules: Union[Iterable[Union[str, ModuleType]],
+                                  None] = None
+) -> list[type]:
+    """Get the loaded classes that implement the protocol `proto` (as
+    `implements` does), in order of discovery.
+
+    Classes are found in the subclass tree of `object` the first time
+    this is called, and among the new direct subclasses of `object`
+    and in the namespaces of newly imported modules (along with their
+    subclasses and nested classes) on later calls, so the index is
+    updated incrementally rather than rebuilt. Each class is checked
+    against the per-type capability cache, so repeated queries only
+    resolve the members of classes that were not checked before.
+
+    If `modules` is given (as module objects or names), only classes
+    defined in those modules (by `__module__`) are included, and the
+    namespaces of those modules are always rescanned. Otherwise,
+    subclasses of other classes created after the first call in
+    modules that were already imported by then are only found once
+    they are bound in the namespace of a newly imported module.
+    Protocol definitions themselves are excluded.
+
+    """
+    info = _info(proto)
+    names = None if modules is None else {
+        module if isinstance(module, str) else module.__name__
+        for module in modules
+    }
+    _refresh(names)
+    found = []
+    for ref in list(_order):
+        cls = ref()
+        if cls is None or getattr(cls, "_is_protocol", False):
+            continue
+        if names is not None and cls.__module__ not in names:
+            continue
+        if _check(cls, info):
+            found.append(cls)
+    return found
@@ -0,0 +1,161 @@
+"""Validation of large iterables across a process pool.
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
+from itertools import islice
+from typing import (
+    Any,
+    Union,
+)
+
+from ._check import (
+    _info,
+    implements,
+    supports,
+)
+
+
+__all__ = (
+    "parallel_check",
+)
+
+
+# Types whose capabilities are resolved when a worker starts.
+_WARM_TYPES = (
+    type(None), bool, int, float, complex, str, bytes, bytearray, list,
+    tuple, dict, set, frozenset,
+)
+
+# the protocol and strictness checked by the current worker process
+_proto: Any = None
+_strict = False
+
+
+def _warm(proto: Any, strict: bool) -> None:
+    """Initialize a worker process, resolving `proto` and its
+    capabilities for common types up front.
+
+    """
+    global _proto, _strict
+    _proto = proto
+    _strict = strict
+    for cls in _WARM_TYPES:
+        implements(cls, proto, strict=strict)
+
+
+def _check_chunk(chunk: list[Any]) -> bytes:
+    """Check each item of `chunk` in a worker, returning a byte per
+    item (1 if it supports the protocol).
+
+    """
+    proto = _proto
+    strict = _strict
+    types = list(map(type, chunk))
+    verdicts = {
+        cls: implements(cls, proto, strict=strict) for cls in set(types)
+    }
+    results = bytes(map(verdicts.__getitem__, types))
+    if all(verdicts.values()) or not _info(proto).data:
+        return results
+    # data members may be set on the instances themselves
+    fixed = bytearray(results)
+    for index, cls in enumerate(types):
+        if not verdicts[cls]:
+            fixed[index] = supports(chunk[index], proto, strict=strict)
+    return bytes(fixed)
+
+
+def parallel_check(
+    iterable: Iterable[Any], proto: Any, /, *,
+    workers: Union[int, None] = None, chunksize: int = 4096,
+    ordered: bool = True, strict: bool = False
+) -> Iterator[Any]:
+    """Check whether each item of `iterable` supports `proto` (as
+    `supports` does) across a pool of `workers` processes (by default,
+    one per CPU).
+
+    `iterable` is consumed lazily, `chunksize` items at a time, with at
+    most two chunks per worker in flight, so inputs larger than memory
+    can be streamed through. Each worker resolves `proto` and the
+    capabilities of common builtin types when it starts, and checks
+    each distinct type in a chunk only once. The items and `proto` must
+    be picklable.
+
+    If `ordered` is `True`, a `bool` is yielded per item, in order.
+    Otherwise, `(index, result)` pairs are yielded as chunks complete.
+
+    """
+    import os
+    from collections import deque
+    from concurrent.futures import (
+        FIRST_COMPLETED,
+        ProcessPoolExecutor,
+        wait,
+    )
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    _info(proto)
+    iterator = iter(iterable)
+    with ProcessPoolExecutor(
+        workers, initializer=_warm, initargs=(proto, strict)
+    ) as executor:
+        limit = 2 * workers
+        # futures in order of submission if `ordered`, otherwise a
+        # mapping of futures to the index of the first item of their
+        # chunk
+        pending: Any = deque() if ordered else {}
+        start = 0
+
+        def submit() -> bool:
+            nonlocal start
+            chunk = list(islice(iterator, chunksize))
+            if not chunk:
+                return False
+            future = executor.submit(_check_chunk, chunk)
+            if ordered:
+                pending.append(future)
+            else:
+                pending[future] = start
+            start += len(chunk)
+            return True
+
+        try:
+            while len(pending) < limit and submit():
+                pass
+            if ordered:
+                while pending:
+                    future = pending.popleft()
+                    results = future.result()
+                    submit()
+                    yield from map(bool, results)
+            else:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        offset = pending.pop(future)
+                        results = future.result()
+                        submit()
+                        yield from zip(
+                            range(offset, offset + len(results)),
+                            map(bool, results),
+                        )
+        finally:
+            for future in pending:
+                future.cancel()
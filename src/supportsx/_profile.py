@@ -0,0 +1,217 @@
+"""Attribution of protocol checks to their call sites.
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import os
+import sys
+import time
+from typing import (
+    Any,
+    Callable,
+    Protocol,
+    TextIO,
+    Union,
+)
+
+from . import _check
+
+
+__all__ = (
+    "Profiler",
+)
+
+
+# Frames from these files are skipped when attributing a check.
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+_TYPING_FILE = getattr(sys.modules.get("typing"), "__file__", None)
+
+# The methods of `typing._ProtocolMeta` replaced while recording (which
+# are inherited from `ABCMeta` on some versions).
+_CHECKS = ("__instancecheck__", "__subclasscheck__")
+_MISSING = object()
+
+
+def _call_site(frame: Any) -> tuple[str, int]:
+    """Get the first `(filename, lineno)` outside of supportsx and
+    `typing`, starting from `frame`.
+
+    """
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            not filename.startswith(_PACKAGE_DIR)
+            and filename != _TYPING_FILE
+        ):
+            return filename, frame.f_lineno
+        frame = frame.f_back
+    return "<unknown>", 0
+
+
+def _is_supportsx(proto: Any) -> bool:
+    module = getattr(proto, "__module__", "")
+    return module == "supportsx" or module.startswith("supportsx.")
+
+
+class _Site:
+    """The statistics of a single call site."""
+
+    __slots__ = ("count", "time", "misses", "types", "protos")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.time = 0.0
+        self.misses = 0
+        self.types: set[type] = set()
+        self.protos: set[str] = set()
+
+
+class Profiler:
+    """Records every protocol check (through `supports`, `implements`,
+    composites, and `isinstance`/`issubclass` against supportsx
+    protocols) by its calling file and line, along with the time spent,
+    the types checked, and how many checks missed the capability cache.
+
+    Checks made through `isinstance` and `issubclass` go through
+    `typing`, which has no cache, so they are always counted as misses.
+    A `Checker` only falls back to `supports` (and is only recorded)
+    for types it has not cached itself.
+
+    Use as a context manager, or with `enable` and `disable`, and print
+    the results with `report` (or run `python -m supportsx profile`).
+
+    """
+
+    def __init__(self) -> None:
+        self._sites: dict[tuple[str, int], _Site] = {}
+        # the entries of `_CHECKS` in the namespace of `_ProtocolMeta`
+        # (`_MISSING` if inherited) while recording
+        self._originals: Union[dict[str, Any], None] = None
+        # the number of checks in progress, as checks made while
+        # another is in progress (e.g. `typing` calling
+        # `__subclasscheck__` from `__instancecheck__`) are not recorded
+        self._depth = 0
+
+    def _timed(
+        self, check: Callable[..., bool], args: tuple[Any, ...], cls: type,
+        proto: Any, miss: bool
+    ) -> bool:
+        """Call `check(*args)`, recording it unless nested."""
+        if self._depth:
+            return check(*args)
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            return check(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._depth -= 1
+            self._record(cls, proto, elapsed, miss)
+
+    def _record(
+        self, cls: type, proto: Any, elapsed: float, miss: bool
+    ) -> None:
+        key = _call_site(sys._getframe(1))
+        try:
+            site = self._sites[key]
+        except KeyError:
+            site = self._sites[key] = _Site()
+        site.count += 1
+        site.time += elapsed
+        site.misses += miss
+        site.types.add(cls)
+        site.protos.add(getattr(proto, "__qualname__", repr(proto)))
+
+    def _observe(
+        self, check: Callable[[Any, Any, bool], bool], subject: Any,
+        cls: type, proto: Any, strict: bool
+    ) -> bool:
+        info = _check._info(proto)
+        entry = _check._capabilities.get(id(cls))
+        miss = entry is None or entry.known & info.mask != info.mask
+        return self._timed(check, (subject, proto, strict), cls, proto, miss)
+
+    def enable(self) -> None:
+        """Start recording checks."""
+        if self._originals is not None:
+            return
+        meta: Any = type(Protocol)
+        self._originals = {
+            name: meta.__dict__.get(name, _MISSING) for name in _CHECKS
+        }
+        instancecheck = meta.__instancecheck__
+        subclasscheck = meta.__subclasscheck__
+        timed = self._timed
+
+        def __instancecheck__(cls: Any, instance: Any) -> bool:
+            if not _is_supportsx(cls):
+                return instancecheck(cls, instance)
+            return timed(
+                instancecheck, (cls, instance), type(instance), cls, True
+            )
+
+        def __subclasscheck__(cls: Any, other: Any) -> bool:
+            if not _is_supportsx(cls):
+                return subclasscheck(cls, other)
+            return timed(subclasscheck, (cls, other), other, cls, True)
+
+        meta.__instancecheck__ = __instancecheck__
+        meta.__subclasscheck__ = __subclasscheck__
+        _check._observer = self._observe
+
+    def disable(self) -> None:
+        """Stop recording checks."""
+        if self._originals is None:
+            return
+        meta = type(Protocol)
+        for name, original in self._originals.items():
+            if original is _MISSING:
+                delattr(meta, name)
+            else:
+                setattr(meta, name, original)
+        self._originals = None
+        _check._observer = None
+
+    def __enter__(self) -> "Profiler":
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.disable()
+
+    def report(
+        self, file: Union[TextIO, None] = None, *, sort: str = "time",
+        limit: Union[int, None] = None
+    ) -> None:
+        """Print the recorded call sites, sorted by `"time"` or
+        `"count"` (descending).
+
+        """
+        if sort not in ("time", "count"):
+            raise ValueError(f"invalid sort key {sort!r}")
+        file = sys.stdout if file is None else file
+        sites = sorted(
+            self._sites.items(),
+            key=lambda item: getattr(item[1], sort),
+            reverse=True,
+        )[:limit]
+        print(
+            f"{'checks':>10} {'total ms':>10} {'types':>6} {'miss %':>7}"
+            "  site (protocols)",
+            file=file,
+        )
+        for (filename, lineno), site in sites:
+            print(
+                f"{site.count:>10} {site.time * 1000:>10.3f}"
+                f" {len(site.types):>6}"
+                f" {100 * site.misses / site.count:>7.1f}"
+                f"  {filename}:{lineno} ({', '.join(sorted(site.protos))})",
+                file=file,
+            )
@@ -0,0 +1,86 @@
+"""Pickling support for subscripted protocols.
+
+Plain protocols (and their aliases, such as `supportsx.add`, which are
+the same objects) already pickle by reference. This module registers a
+reducer with `copyreg` for subscripted protocols (e.g.
+`supportsx.add[Any, int]`), which are pickled as the name of the
+protocol and its arguments, and interned on load. Composites are
+handled by `_compose`.
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import copyreg
+import functools
+import typing
+from importlib import import_module
+from typing import (
+    Any,
+    Callable,
+)
+
+
+__all__ = ()
+
+
+# Modules that define protocols (which are searched in order for the
+# name of a protocol when unpickling).
+_MODULES = (
+    "supportsx._supports",
+    "supportsx.u._unions",
+)
+
+# `typing._GenericAlias` is the (private) type of subscripted
+# user-defined generics, including protocols.
+_GenericAlias: Any = type(
+    typing.Generic[typing.TypeVar("_T")]  # type: ignore[index]
+)
+
+_alias_reducer: Callable[[Any], Any] = copyreg.dispatch_table.get(
+    _GenericAlias, _GenericAlias.__reduce__
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _intern(name: str, args: Any) -> Any:
+    """Get the protocol named `name`, subscripted with `args`."""
+    for module in _MODULES:
+        proto = getattr(import_module(module), name, None)
+        if proto is not None:
+            return proto[args]
+    raise AttributeError(f"no protocol named {name!r}")
+
+
+def _subscript(name: str, args: Any) -> Any:
+    """Unpickle a subscripted protocol (see `_reduce_alias`)."""
+    try:
+        return _intern(name, args)
+    except TypeError:
+        # unhashable arguments
+        return _intern.__wrapped__(name, args)
+
+
+def _reduce_alias(alias: Any) -> Any:
+    """Pickle subscripted supportsx protocols as the name of the
+    protocol and its arguments, and other aliases as `typing` does.
+
+    """
+    origin = alias.__origin__
+    if getattr(origin, "__module__", None) not in _MODULES:
+        return _alias_reducer(alias)
+    args = alias.__args__
+    # subscripting with a single argument is cached by `typing`
+    # separately from subscripting with a 1-tuple
+    if len(args) == 1 and not isinstance(args[0], tuple):
+        args = args[0]
+    return _subscript, (origin.__name__, args)
+
+
+copyreg.pickle(_GenericAlias, _reduce_alias)
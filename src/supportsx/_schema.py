@@ -0,0 +1,258 @@
+"""Validation of nested data against trees of protocols.
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+from collections.abc import (
+    Mapping,
+    Sequence,
+)
+from itertools import repeat
+from typing import (
+    Any,
+    Union,
+)
+
+from ._check import (
+    _ProtocolInfo,
+    _capabilities,
+    _check,
+    _check_instance,
+    _info,
+)
+
+
+__all__ = (
+    "Schema",
+)
+
+
+# Kinds of compiled schema nodes.
+_LEAF = 0  # `(_LEAF, info, mask, name)`
+# `(_RECORD, ((key, node), ...), ((key, info, mask), ...) for leaves,
+# ((key, node), ...) for the rest)`
+_RECORD = 1
+_ARRAY = 2  # `(_ARRAY, node)`
+# a key missing from a record, reported when popped so that failures
+# stay in document order (only used by `_failures`)
+_ABSENT = 3
+_ABSENT_NODE = (_ABSENT,)
+
+_MISSING: Any = object()
+# sequences that are not arrays of items
+_SCALARS = (str, bytes, bytearray)
+
+_Path = tuple[Union[str, int, Any], ...]
+
+
+def _compile(description: Any) -> tuple[Any, ...]:
+    """Compile `description` into a tree of nodes."""
+    if isinstance(description, dict):
+        fields = tuple(
+            (key, _compile(value)) for key, value in description.items()
+        )
+        return (
+            _RECORD,
+            fields,
+            tuple(
+                (key, child[1], child[2]) for key, child in fields
+                if child[0] == _LEAF
+            ),
+            tuple(
+                (key, child) for key, child in fields
+                if child[0] != _LEAF
+            ),
+        )
+    if isinstance(description, list):
+        if len(description) != 1:
+            raise TypeError(
+                "array descriptions must have exactly one item"
+            )
+        return (_ARRAY, _compile(description[0]))
+    try:
+        info = _info(description)
+    except TypeError:
+        raise TypeError(
+            f"invalid schema description {description!r}"
+        ) from None
+    name = getattr(description, "__qualname__", repr(description))
+    # composites satisfied by any of several protocols have no mask of
+    # their own, so they always take the slow path (as no type has all
+    # of the bits of -1)
+    mask = -1 if info.alternatives is not None else info.mask
+    return (_LEAF, info, mask, name)
+
+
+def _leaf(value: Any, info: _ProtocolInfo) -> bool:
+    """Check whether `value` supports `info` (as `supports` does)."""
+    cls = type(value)
+    return _check(cls, info) or bool(info.data) and _check_instance(
+        value, cls, info
+    )
+
+
+def _is_mapping(value: Any) -> bool:
+    return type(value) is dict or isinstance(value, Mapping)
+
+
+def _is_array(value: Any) -> bool:
+    cls = type(value)
+    return cls is list or cls is tuple or (
+        isinstance(value, Sequence) and not isinstance(value, _SCALARS)
+    )
+
+
+def _valid(root: tuple[Any, ...], data: Any) -> bool:
+    """Check whether `data` matches `root`, stopping at the first
+    failure.
+
+    """
+    capabilities = _capabilities
+    stack = [(root, data)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node, value = pop()
+        kind = node[0]
+        if kind == _LEAF:
+            if not _leaf(value, node[1]):
+                return False
+        elif kind == _RECORD:
+            if not _is_mapping(value):
+                return False
+            get = value.get
+            # leaves are checked in place, against the cache entry of
+            # their type if it is complete (the bits of `present` are
+            # always also known)
+            for key, info, mask in node[2]:
+                item = get(key, _MISSING)
+                if item is _MISSING:
+                    return False
+                entry = capabilities.get(id(type(item)))
+                if (
+                    entry is None or entry.present & mask != mask
+                ) and not _leaf(item, info):
+                    return False
+            for key, child in node[3]:
+                item = get(key, _MISSING)
+                if item is _MISSING:
+                    return False
+                push((child, item))
+        else:
+            if not _is_array(value):
+                return False
+            child = node[1]
+            if child[0] == _LEAF:
+                # check each distinct type once, and only fall back to
+                # the items themselves for data members
+                info = child[1]
+                for cls in set(map(type, value)):
+                    if not _check(cls, info) and not (
+                        info.data and all(
+                            _check_instance(item, cls, info)
+                            for item in value if type(item) is cls
+                        )
+                    ):
+                        return False
+            else:
+                stack.extend(zip(repeat(child), value))
+    return True
+
+
+def _failures(
+    root: tuple[Any, ...], data: Any
+) -> list[tuple[_Path, str]]:
+    """Get every failure of `data` to match `root`, in document
+    order.
+
+    """
+    failures: list[tuple[_Path, str]] = []
+    stack: list[tuple[tuple[Any, ...], Any, _Path]] = [(root, data, ())]
+    pop = stack.pop
+    while stack:
+        node, value, path = pop()
+        kind = node[0]
+        if kind == _LEAF:
+            if not _leaf(value, node[1]):
+                failures.append((path, f"does not support {node[3]}"))
+        elif kind == _ABSENT:
+            # `value` is the missing key
+            failures.append((path, f"missing key {value!r}"))
+        elif kind == _RECORD:
+            if not _is_mapping(value):
+                failures.append((path, "expected a mapping"))
+                continue
+            get = value.get
+            children = []
+            for key, child in node[1]:
+                item = get(key, _MISSING)
+                if item is _MISSING:
+                    children.append((_ABSENT_NODE, key, path))
+                else:
+                    children.append((child, item, (*path, key)))
+            stack.extend(reversed(children))
+        else:
+            if not _is_array(value):
+                failures.append((path, "expected a sequence"))
+                continue
+            child = node[1]
+            stack.extend(
+                (child, value[index], (*path, index))
+                for index in range(len(value) - 1, -1, -1)
+            )
+    return failures
+
+
+class Schema:
+    """A validator for nested data, compiled once from a description of
+    the protocols that its leaves must support.
+
+    A description is either:
+
+    - a protocol (anything accepted by `supports`, including unions and
+      composites), which the value must support;
+    - a `dict` of descriptions, where the value must be a mapping
+      containing (at least) each of its keys, whose values must match
+      the corresponding descriptions;
+    - a `list` of a single description, where the value must be a
+      sequence (other than `str`, `bytes`, or `bytearray`) whose items
+      all match that description.
+
+    For example, `Schema({"id": index, "points": [{"x": float}]})`.
+
+    Payloads are walked iteratively (so arbitrarily deep payloads do
+    not hit the recursion limit), leaves are checked against the
+    per-type capability cache shared with `supports`, and arrays of
+    leaves only check each distinct type of their items once. Calling
+    the schema stops at the first failure; use `failures` to collect
+    all of them.
+
+    """
+
+    __slots__ = ("description", "_root")
+
+    def __init__(self, description: Any) -> None:
+        self.description = description
+        self._root = _compile(description)
+
+    def __call__(self, data: Any, /) -> bool:
+        """Check whether `data` matches the schema."""
+        return _valid(self._root, data)
+
+    def failures(self, data: Any, /) -> list[tuple[_Path, str]]:
+        """Get every failure of `data` to match the schema, as
+        `(path, reason)` pairs in document order, where `path` is the
+        tuple of keys and indices leading to the failing value.
+
+        """
+        return _failures(self._root, data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}({self.description!r})"
@@ -0,0 +1,285 @@
+"""Sorted indexes over values that support `__lt__` (`SupportsLT`).
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
+from itertools import (
+    chain,
+    islice,
+)
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    TypeVar,
+    Union,
+)
+
+
+__all__ = (
+    "SortedIndex",
+)
+
+
+_T = TypeVar("_T")
+
+# The target length of each sublist (which are split at twice this).
+_LOAD = 1000
+
+
+class SortedIndex(Generic[_T]):
+    """A sorted collection of values, ordered by `key(value)` (or by the
+    values themselves if `key` is `None`).
+
+    Values are kept in a list of sorted sublists of about `_LOAD`
+    items, with the last key of each sublist in a separate list, so
+    `add`, `remove`, and range queries (`irange`) locate values by
+    bisecting twice, and only move the items of a single sublist. Keys
+    are extracted once per value (when it is added) and kept alongside
+    the values. Keys are only ever compared with `<` (as with `sorted`
+    and `bisect`), so they need only support `__lt__`. Values that
+    compare equivalent keep their order of insertion.
+
+    Supports `SupportsLen`, `SupportsIter`, `SupportsReversed`, and
+    `SupportsContains`.
+
+    """
+
+    __slots__ = ("key", "_keys", "_values", "_maxes", "_len")
+
+    def __init__(
+        self, iterable: Iterable[_T] = (), /, *,
+        key: Union[Callable[[_T], Any], None] = None
+    ) -> None:
+        self.key = key
+        # sublists of keys, and of values (the same lists if `key` is
+        # `None`)
+        self._keys: list[list[Any]] = []
+        self._values: list[list[_T]] = self._keys
+        # the last key of each sublist
+        self._maxes: list[Any] = []
+        self._len = 0
+        self.update(iterable)
+
+    def _build(
+        self, values: list[_T], keys: Union[list[Any], None] = None
+    ) -> None:
+        """Replace the contents with `values`, which are sorted here.
+
+        If given, `keys` are the keys of `values` (which are otherwise
+        computed here).
+
+        """
+        key = self.key
+        if key is None:
+            values.sort()
+            self._keys = self._values = [
+                values[start:start + _LOAD]
+                for start in range(0, len(values), _LOAD)
+            ]
+        else:
+            if keys is None:
+                keys = list(map(key, values))
+            pairs = sorted(zip(keys, values), key=lambda pair: pair[0])
+            keys = [pair[0] for pair in pairs]
+            values = [pair[1] for pair in pairs]
+            self._keys = [
+                keys[start:start + _LOAD]
+                for start in range(0, len(keys), _LOAD)
+            ]
+            self._values = [
+                values[start:start + _LOAD]
+                for start in range(0, len(values), _LOAD)
+            ]
+        self._maxes = [keys[-1] for keys in self._keys]
+        self._len = len(values)
+
+    def add(self, value: _T, /) -> None:
+        """Add `value` (after any values with equivalent keys)."""
+        key = value if self.key is None else self.key(value)
+        maxes = self._maxes
+        self._len += 1
+        if not maxes:
+            self._keys.append([key])
+            if self.key is not None:
+                self._values.append([value])
+            maxes.append(key)
+            return
+        pos = bisect_right(maxes, key)
+        keys = self._keys
+        if pos == len(maxes):
+            # after every existing key
+            pos -= 1
+            keys[pos].append(key)
+            if self.key is not None:
+                self._values[pos].append(value)
+            maxes[pos] = key
+        else:
+            sublist = keys[pos]
+            index = bisect_right(sublist, key)
+            sublist.insert(index, key)
+            if self.key is not None:
+                self._values[pos].insert(index, value)
+        if len(keys[pos]) > 2 * _LOAD:
+            self._split(pos)
+
+    def _split(self, pos: int) -> None:
+        """Split the sublist at `pos` in half."""
+        keys = self._keys[pos]
+        self._keys[pos:pos + 1] = [keys[:_LOAD], keys[_LOAD:]]
+        if self.key is not None:
+            values = self._values[pos]
+            self._values[pos:pos + 1] = [values[:_LOAD], values[_LOAD:]]
+        self._maxes.insert(pos, self._keys[pos][-1])
+
+    def update(self, iterable: Iterable[_T], /) -> None:
+        """Add each value of `iterable`."""
+        values = list(iterable)
+        if len(values) * 4 >= self._len:
+            # cheaper to sort everything again, reusing the stored keys
+            # (the sort is stable, so new values stay after equivalent
+            # ones)
+            stored = list(chain.from_iterable(self._values))
+            if self.key is None:
+                self._build(stored + values)
+            else:
+                self._build(
+                    stored + values,
+                    list(chain.from_iterable(self._keys))
+                    + list(map(self.key, values)),
+                )
+        else:
+            for value in values:
+                self.add(value)
+
+    def _find(self, value: _T) -> Union[tuple[int, int], None]:
+        """Get the position of the first value equal to `value` (among
+        those with equivalent keys), or `None` if there is none.
+
+        """
+        key = value if self.key is None else self.key(value)
+        maxes = self._maxes
+        pos = bisect_left(maxes, key)
+        if pos == len(maxes):
+            return None
+        index = bisect_left(self._keys[pos], key)
+        keys = self._keys
+        values = self._values
+        while pos < len(maxes):
+            sublist = keys[pos]
+            for index in range(index, len(sublist)):
+                if key < sublist[index]:
+                    return None
+                if values[pos][index] == value:
+                    return pos, index
+            pos += 1
+            index = 0
+        return None
+
+    def _delete(self, pos: int, index: int) -> None:
+        """Delete the value at `index` in the sublist at `pos`."""
+        keys = self._keys[pos]
+        del keys[index]
+        if self.key is not None:
+            del self._values[pos][index]
+        self._len -= 1
+        if not keys:
+            del self._keys[pos]
+            if self.key is not None:
+                del self._values[pos]
+            del self._maxes[pos]
+        elif index == len(keys):
+            self._maxes[pos] = keys[-1]
+
+    def remove(self, value: _T, /) -> None:
+        """Remove a value equal to `value`, raising a `ValueError` if
+        there is none.
+
+        """
+        found = self._find(value)
+        if found is None:
+            raise ValueError(f"{value!r} not in {type(self).__qualname__}")
+        self._delete(*found)
+
+    def discard(self, value: _T, /) -> None:
+        """Remove a value equal to `value`, if there is one."""
+        found = self._find(value)
+        if found is not None:
+            self._delete(*found)
+
+    def clear(self) -> None:
+        """Remove every value."""
+        self._keys = []
+        self._values = self._keys if self.key is None else []
+        self._maxes = []
+        self._len = 0
+
+    def _locate(self, key: Any, right: bool) -> tuple[int, int]:
+        """Get the position of the first value whose key is not less
+        than (or, if `right`, greater than) `key`.
+
+        """
+        bisect = bisect_right if right else bisect_left
+        pos = bisect(self._maxes, key)
+        if pos == len(self._maxes):
+            return pos, 0
+        return pos, bisect(self._keys[pos], key)
+
+    def irange(
+        self, minimum: Any = None, maximum: Any = None, *,
+        inclusive: tuple[bool, bool] = (True, True)
+    ) -> Iterator[_T]:
+        """Iterate over the values whose keys are between `minimum` and
+        `maximum` (either of which may be `None` for no bound), in
+        order. `inclusive` determines whether keys equivalent to each
+        bound are included.
+
+        """
+        if minimum is None:
+            start = (0, 0)
+        else:
+            start = self._locate(minimum, not inclusive[0])
+        if maximum is None:
+            stop = (len(self._maxes), 0)
+        else:
+            stop = self._locate(maximum, inclusive[1])
+        pos, index = start
+        stop_pos, stop_index = stop
+        values = self._values
+        while pos < stop_pos:
+            yield from islice(values[pos], index, None)
+            pos += 1
+            index = 0
+        if pos == stop_pos and pos < len(values):
+            yield from islice(values[pos], index, stop_index)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[_T]:
+        return chain.from_iterable(self._values)
+
+    def __reversed__(self) -> Iterator[_T]:
+        return chain.from_iterable(map(reversed, reversed(self._values)))
+
+    def __contains__(self, value: object, /) -> bool:
+        return self._find(value) is not None  # type: ignore[arg-type]
+
+    def __repr__(self) -> str:
+        key = "" if self.key is None else f", key={self.key!r}"
+        return f"{type(self).__qualname__}({list(self)!r}{key})"
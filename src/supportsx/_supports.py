@@ -31,6 +31,8 @@ else:
     from typing_extensions import ParamSpec
 from types import TracebackType
 
+from ._check import _class_checkable
+
 
 _T = TypeVar("_T")
 _T_co = TypeVar("_T_co", covariant=True)
@@ -895,6 +897,7 @@ class SupportsLT(Protocol[_T_contra]):
 
 
 @runtime_checkable
+@_class_checkable
 class SupportsMatchArgs(Protocol):
     """A protocol with one abstract property `__match_args__` of the
     form `() -> Sequence[str]`.
@@ -1008,6 +1011,7 @@ class SupportsNext(Protocol[_T_co]):
 
 
 @runtime_checkable
+@_class_checkable
 class SupportsObjClass(Protocol[_T_co]):
     """A protocol `[_T_co]` with one abstract property `__objclass__` of
     the form `() -> Type[_T_co]`.
@@ -0,0 +1,188 @@
+"""Low-overhead tracing of protocol checks with `sys.monitoring`
+(PEP 669, 3.12+).
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import sys
+import threading
+from abc import ABCMeta
+from typing import (
+    Any,
+    Protocol,
+    Union,
+)
+
+from ._check import (
+    implements,
+    supports,
+)
+from ._profile import _is_supportsx
+
+
+__all__ = (
+    "Tracer",
+)
+
+
+# `sys.monitoring` tool IDs that are not reserved for debuggers,
+# coverage tools, profilers (e.g. `cProfile`), or optimizers.
+_TOOL_IDS = (3, 4)
+_TOOL_NAME = "supportsx"
+
+
+class Tracer:
+    """Counts protocol checks made through `supports` and `implements`
+    (including those made by composites and `Checker`s), and through
+    `isinstance` and `issubclass` against supportsx protocols, by
+    protocol and type, using `sys.monitoring` (3.12+).
+
+    Nothing is monitored until `start` is called, and `stop` removes
+    every event again, so an idle tracer costs nothing. A tracer can be
+    started and stopped at any point while the process is running (from
+    any thread). Only every `every`-th check is recorded, which keeps
+    the cost of active tracing down on hot paths; the counts are not
+    scaled back up.
+
+    """
+
+    __slots__ = ("every", "_counts", "_countdown", "_tool", "_lock")
+
+    def __init__(self, *, every: int = 1) -> None:
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.every = every
+        self._counts: dict[tuple[Any, type], int] = {}
+        self._countdown = every
+        self._tool: Union[int, None] = None
+        self._lock = threading.Lock()
+
+    def _on_start(self, code: Any, offset: int) -> None:
+        """The `PY_START` callback for `supports`, `implements`, and the
+        `isinstance` and `issubclass` hooks of protocols.
+
+        """
+        frame = sys._getframe(1)
+        arguments = frame.f_locals
+        if code is _SUPPORTS_CODE:
+            proto = arguments["proto"]
+            cls = type(arguments["obj"])
+        elif code is _IMPLEMENTS_CODE:
+            proto = arguments["proto"]
+            cls = arguments["cls"]
+        else:
+            # the hooks run for every protocol, and `typing` makes
+            # nested checks (e.g. `__subclasscheck__` from
+            # `__instancecheck__`), which are not counted again
+            proto = arguments["cls"]
+            caller: Any = frame.f_back
+            if not _is_supportsx(proto) or caller.f_code in _NESTED_CODES:
+                return
+            cls = arguments[code.co_varnames[1]]
+            if code is _INSTANCECHECK_CODE:
+                cls = type(cls)
+        self._countdown -= 1
+        if self._countdown > 0:
+            return
+        self._countdown = self.every
+        key = (proto, cls)
+        counts = self._counts
+        counts[key] = counts.get(key, 0) + 1
+
+    @property
+    def active(self) -> bool:
+        """Whether the tracer is started."""
+        return self._tool is not None
+
+    def start(self) -> None:
+        """Start tracing checks.
+
+        A `RuntimeError` is raised before 3.12, or if every
+        `sys.monitoring` tool ID that supportsx may use is taken.
+
+        """
+        if sys.version_info < (3, 12):
+            raise RuntimeError("tracing requires Python 3.12+")
+        monitoring = sys.monitoring
+        with self._lock:
+            if self._tool is not None:
+                return
+            for tool in _TOOL_IDS:
+                if monitoring.get_tool(tool) is None:
+                    break
+            else:
+                raise RuntimeError("no sys.monitoring tool ID is free")
+            monitoring.use_tool_id(tool, _TOOL_NAME)
+            event = monitoring.events.PY_START
+            monitoring.register_callback(tool, event, self._on_start)
+            for code in _CODES:
+                monitoring.set_local_events(tool, code, event)
+            self._tool = tool
+
+    def stop(self) -> None:
+        """Stop tracing checks (keeping the counts)."""
+        with self._lock:
+            tool = self._tool
+            # the version check is for type checkers (`start` fails
+            # before 3.12)
+            if tool is None or sys.version_info < (3, 12):
+                return
+            monitoring = sys.monitoring
+            for code in _CODES:
+                monitoring.set_local_events(
+                    tool, code, monitoring.events.NO_EVENTS
+                )
+            monitoring.register_callback(
+                tool, monitoring.events.PY_START, None
+            )
+            monitoring.free_tool_id(tool)
+            self._tool = None
+
+    def __enter__(self) -> "Tracer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def counts(self) -> dict[tuple[Any, type], int]:
+        """Get the number of recorded checks, keyed by
+        `(protocol, type)`.
+
+        """
+        return dict(self._counts)
+
+    def by_protocol(self) -> dict[Any, int]:
+        """Get the number of recorded checks, keyed by protocol."""
+        totals: dict[Any, int] = {}
+        for (proto, _), count in self.counts().items():
+            totals[proto] = totals.get(proto, 0) + count
+        return totals
+
+    def clear(self) -> None:
+        """Forget the recorded checks."""
+        self._counts.clear()
+        self._countdown = self.every
+
+
+_SUPPORTS_CODE = supports.__code__
+_IMPLEMENTS_CODE = implements.__code__
+# the hooks of `typing._ProtocolMeta` (Python functions on 3.12+)
+_INSTANCECHECK_CODE = type(Protocol).__instancecheck__.__code__
+_SUBCLASSCHECK_CODE = type(Protocol).__subclasscheck__.__code__
+_CODES = (
+    _SUPPORTS_CODE, _IMPLEMENTS_CODE, _INSTANCECHECK_CODE,
+    _SUBCLASSCHECK_CODE,
+)
+# checks called from these are made by `typing` itself
+_NESTED_CODES = frozenset((
+    _INSTANCECHECK_CODE, _SUBCLASSCHECK_CODE,
+    ABCMeta.__instancecheck__.__code__, ABCMeta.__subclasscheck__.__code__,
+))
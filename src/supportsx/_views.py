@@ -0,0 +1,155 @@
+"""Lazy views over sequences that support `__getitem__` and `__len__`
+(`SupportsGetItem`/`SupportsLen`).
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+from collections.abc import Iterator
+from typing import (
+    Any,
+    Generic,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from ._check import (
+    _capabilities_of,
+    _has,
+    _lookup,
+)
+
+
+__all__ = (
+    "SequenceView",
+    "iter_reversed",
+    "view",
+)
+
+
+_T_co = TypeVar("_T_co", covariant=True)
+
+# Reverse iteration strategies, cached per type.
+_UNSUPPORTED = 0
+_REVERSED = 1  # `obj.__reversed__()`
+_INDEXED = 2  # `obj[i]` for `i` from `len(obj) - 1` down to 0
+
+
+class SequenceView(Generic[_T_co]):
+    """A lazy view over a slice of a sequence.
+
+    Supports `SupportsGetItem[int | slice, ...]`, `SupportsLen`,
+    `SupportsIter`, and `SupportsReversed`. Nothing is copied: indices
+    are translated to indices of the underlying sequence on access, and
+    slicing a view produces another view over the same sequence. The
+    bounds of a view are fixed when it is created, so it should not
+    outlive changes to the length of the underlying sequence.
+
+    """
+
+    __slots__ = ("_seq", "_indices")
+
+    def __init__(self, seq: Any, indices: range) -> None:
+        self._seq = seq
+        # the indices of `seq` covered by the view, which translates
+        # (and composes) indices and slices without materializing them
+        self._indices = indices
+
+    @overload
+    def __getitem__(self, key: int, /) -> _T_co:
+        pass
+
+    @overload
+    def __getitem__(self, key: slice, /) -> "SequenceView[_T_co]":
+        pass
+
+    def __getitem__(
+        self, key: Union[int, slice], /
+    ) -> Union[_T_co, "SequenceView[_T_co]"]:
+        if isinstance(key, slice):
+            return SequenceView(self._seq, self._indices[key])
+        try:
+            index = self._indices[key]
+        except IndexError:
+            raise IndexError(
+                f"{type(self).__qualname__} index out of range"
+            ) from None
+        return self._seq[index]
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __iter__(self) -> Iterator[_T_co]:
+        return map(self._seq.__getitem__, self._indices)
+
+    def __reversed__(self) -> Iterator[_T_co]:
+        return map(self._seq.__getitem__, reversed(self._indices))
+
+    def __repr__(self) -> str:
+        indices = self._indices
+        return (
+            f"{type(self).__qualname__}({self._seq!r},"
+            f" slice({indices.start}, {indices.stop}, {indices.step}))"
+        )
+
+
+def view(seq: Any, key: slice = slice(None), /) -> SequenceView[Any]:
+    """Get a lazy view over `seq[key]` (see `SequenceView`), where `seq`
+    supports `__getitem__` with integer indices and `__len__`.
+
+    Views of views refer directly to the underlying sequence. A
+    `TypeError` is raised if `key` is not a `slice`.
+
+    """
+    if not isinstance(key, slice):
+        raise TypeError(
+            f"view key must be a slice, not {type(key).__qualname__!r}"
+        )
+    if isinstance(seq, SequenceView):
+        return seq[key]
+    return SequenceView(seq, range(len(seq))[key])
+
+
+def _reverse_strategy(cls: type) -> int:
+    """Get the reverse iteration strategy of `cls`."""
+    entry = _capabilities_of(cls)
+    strategy = entry.reverse
+    if strategy is None:
+        if _has(cls, "__reversed__"):
+            strategy = _REVERSED
+        elif _lookup(cls, "__reversed__", _UNSUPPORTED) is None:
+            # explicitly opted out of reverse iteration
+            strategy = _UNSUPPORTED
+        elif _has(cls, "__len__") and _has(cls, "__getitem__"):
+            strategy = _INDEXED
+        else:
+            strategy = _UNSUPPORTED
+        entry.reverse = strategy
+    return strategy
+
+
+def iter_reversed(obj: Any, /) -> Iterator[Any]:
+    """Iterate over `obj` in reverse, without copying it.
+
+    Uses `__reversed__` if `obj` supports it, and otherwise iterates
+    over the indices from `len(obj) - 1` down to 0 through
+    `__getitem__` (unlike `reversed`, this also works for mappings
+    keyed by index). The strategy is chosen once per type. A
+    `TypeError` is raised if `obj` supports neither, or sets
+    `__reversed__` to `None`.
+
+    """
+    cls = type(obj)
+    strategy = _reverse_strategy(cls)
+    if strategy == _REVERSED:
+        return cls.__reversed__(obj)
+    if strategy == _INDEXED:
+        return map(obj.__getitem__, range(len(obj) - 1, -1, -1))
+    raise TypeError(f"{cls.__qualname__!r} object is not reversible")
@@ -0,0 +1,42 @@
+from typing import Protocol
+
+import supportsx
+from supportsx import _check
+
+
+class Pair(Protocol):
+    def __alpha__(self): ...
+
+    def __omega__(self): ...
+
+
+def _reject(info, count):
+    # fresh types that only lack `__omega__`
+    for index in range(count):
+        cls = type(f"T{index}", (), {"__alpha__": lambda self: None})
+        assert not _check._check(cls, info)
+
+
+def test_members_reordered_after_interval():
+    info = _check._ProtocolInfo(Pair)
+    assert [name for name, _ in info.members] == ["__alpha__", "__omega__"]
+    supportsx.set_adaptive(True)
+    try:
+        _reject(info, _check._REORDER_INTERVAL - 1)
+        assert info.members[0][0] == "__alpha__"
+        assert info.failures["__omega__"] == _check._REORDER_INTERVAL - 1
+        _reject(info, 1)
+    finally:
+        supportsx.set_adaptive(False)
+    assert [name for name, _ in info.members] == ["__omega__", "__alpha__"]
+    # counts are halved after reordering
+    assert info.failures["__omega__"] == _check._REORDER_INTERVAL // 2
+    assert info.rejected == 0
+
+
+def test_disabled_does_not_count():
+    info = _check._ProtocolInfo(Pair)
+    _reject(info, _check._REORDER_INTERVAL * 2)
+    assert info.failures == {"__alpha__": 0, "__omega__": 0}
+    assert info.rejected == 0
+    assert info.members[0][0] == "__alpha__"
@@ -0,0 +1,213 @@
+import asyncio
+
+import pytest
+
+import supportsx
+
+
+class Manager:
+    def __init__(self, delay, error=None):
+        self.delay = delay
+        self.error = error
+        self.state = "new"
+
+    async def __aenter__(self):
+        self.state = "entering"
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.state = "cancelled"
+            raise
+        if self.error is not None:
+            self.state = "failed"
+            raise self.error
+        self.state = "entered"
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.state = "exited"
+
+
+def test_aenter_all():
+    managers = [Manager(0.01), Manager(0)]
+
+    async def main():
+        async with supportsx.aenter_all(managers) as entered:
+            assert entered == managers
+            assert all(m.state == "entered" for m in managers)
+
+    asyncio.run(main())
+    assert all(m.state == "exited" for m in managers)
+
+
+def test_aenter_all_cancels_on_failure():
+    # the slow manager is cancelled as soon as the other one fails,
+    # and its cancellation does not mask the failure
+    slow = Manager(60)
+    fast = Manager(0)
+    failing = Manager(0.01, ValueError("boom"))
+
+    async def main():
+        async with supportsx.aenter_all([slow, fast, failing]):
+            pass
+
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(asyncio.wait_for(main(), 10))
+    assert slow.state == "cancelled"
+    assert fast.state == "exited"
+    assert failing.state == "failed"
+
+
+class Source:
+    """An asynchronous generator that yields `items`, `delay` seconds
+    apart, then raises `error` (if any), recording how it finished.
+
+    """
+
+    def __init__(self, items, delay=0, error=None):
+        self.items = items
+        self.delay = delay
+        self.error = error
+        self.state = "new"
+
+    async def generate(self):
+        self.state = "running"
+        try:
+            for item in self.items:
+                await asyncio.sleep(self.delay)
+                yield item
+            if self.error is not None:
+                raise self.error
+            self.state = "done"
+        except asyncio.CancelledError:
+            self.state = "cancelled"
+            raise
+        except GeneratorExit:
+            self.state = "closed"
+            raise
+
+
+def collect(aiterable):
+    async def main():
+        return [item async for item in aiterable]
+
+    return asyncio.run(asyncio.wait_for(main(), 10))
+
+
+def test_amerge_interleaves():
+    fast = Source(["a1", "a2", "a3"], 0.05)
+    slow = Source(["b1", "b2"], 0.08)
+    result = collect(supportsx.amerge(fast.generate(), slow.generate()))
+    assert result == ["a1", "b1", "a2", "a3", "b2"]
+    assert fast.state == slow.state == "done"
+
+
+def test_amerge_buffer():
+    sources = [Source(range(i, 100, 4)) for i in range(4)]
+    result = collect(
+        supportsx.amerge(*(source.generate() for source in sources),
+                         buffer=8)
+    )
+    assert sorted(result) == list(range(100))
+    with pytest.raises(ValueError):
+        collect(supportsx.amerge(buffer=0))
+    assert collect(supportsx.amerge()) == []
+
+
+def test_amerge_propagates_errors():
+    forever = Source(range(10**6), 0.01)
+    failing = Source([1], 0, ValueError("boom"))
+    with pytest.raises(ValueError, match="boom"):
+        collect(supportsx.amerge(forever.generate(), failing.generate()))
+    assert forever.state in ("cancelled", "closed")
+
+
+def test_amerge_aclose_cancels_sources():
+    first = Source(range(10**6), 0.01)
+    second = Source(range(10**6), 0.01)
+
+    async def main():
+        merged = supportsx.amerge(first.generate(), second.generate())
+        assert await merged.__anext__() == 0
+        await merged.aclose()
+
+    asyncio.run(asyncio.wait_for(main(), 10))
+    assert first.state in ("cancelled", "closed")
+    assert second.state in ("cancelled", "closed")
+
+
+class Later:
+    """A custom awaitable (not a coroutine or future) that returns
+    `value` after `delay` seconds, counting the awaitables in flight.
+
+    """
+
+    active = 0
+    peak = 0
+
+    def __init__(self, value, delay=0, error=None):
+        self.value = value
+        self.delay = delay
+        self.error = error
+        self.cancelled = False
+
+    def __await__(self):
+        return self.run().__await__()
+
+    async def run(self):
+        cls = type(self)
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        finally:
+            cls.active -= 1
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+@pytest.fixture
+def later():
+    Later.active = Later.peak = 0
+    yield Later
+    assert Later.active == 0
+
+
+def test_agather_ordered(later):
+    delays = [0.06, 0.01, 0.04, 0]
+    awaitables = [later(i, delay) for i, delay in enumerate(delays)]
+    assert collect(supportsx.agather(awaitables)) == [0, 1, 2, 3]
+    assert later.peak == 4
+
+
+def test_agather_unordered(later):
+    delays = [0.06, 0.01, 0.04, 0]
+    awaitables = [later(i, delay) for i, delay in enumerate(delays)]
+    result = collect(supportsx.agather(awaitables, ordered=False))
+    assert result == [3, 1, 2, 0]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_agather_limit(later, ordered):
+    # a lazy iterable is only consumed as slots free up
+    awaitables = (later(i, 0.001 * (i % 3)) for i in range(20))
+    result = collect(
+        supportsx.agather(awaitables, limit=3, ordered=ordered)
+    )
+    assert sorted(result) == list(range(20))
+    assert later.peak == 3
+    with pytest.raises(ValueError):
+        collect(supportsx.agather([], limit=0))
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_agather_cancels_on_failure(later, ordered):
+    slow = [later(i, 60) for i in range(3)]
+    failing = later(None, 0.01, ValueError("boom"))
+    with pytest.raises(ValueError, match="boom"):
+        collect(supportsx.agather([*slow, failing], ordered=ordered))
+    assert all(awaitable.cancelled for awaitable in slow)
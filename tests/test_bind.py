@@ -0,0 +1,28 @@
+import inspect
+
+import pytest
+
+import supportsx
+
+
+def target(a, b=2, /, c=3, *args, d, e=5, **kwargs):
+    pass
+
+
+def test_binder_matches_inspect():
+    bind = supportsx.binder(target)
+    signature = inspect.signature(target)
+    for args, kwargs in (
+        ((1,), {"d": 4}),
+        ((1, 2, 3, 4, 5), {"d": 4, "f": 6}),
+    ):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        assert bind(*args, **kwargs) == dict(bound.arguments)
+
+
+def test_binder_raises_like_the_callable():
+    bind = supportsx.binder(target)
+    with pytest.raises(TypeError, match="target"):
+        bind(1)
+    assert supportsx.binder(target) is bind
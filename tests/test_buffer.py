@@ -0,0 +1,64 @@
+import array
+
+import pytest
+
+from supportsx import as_buffer, borrow_buffer
+
+
+class Exporter:
+    def __init__(self, data):
+        self.data = bytearray(data)
+        self.released = []
+
+    def __buffer__(self, flags):
+        return memoryview(self.data)
+
+    def __release_buffer__(self, view):
+        self.released.append(view)
+
+
+@pytest.mark.parametrize(
+    "factory", [bytearray, lambda data: array.array("B", data)]
+)
+def test_builtin_not_copied(factory):
+    obj = factory(b"abc")
+    view = as_buffer(obj)
+    obj[0] = ord("x")
+    assert view[0] == ord("x")
+    view.release()
+
+
+def test_bytes():
+    obj = b"abc"
+    with borrow_buffer(obj) as view:
+        assert view.obj is obj
+        assert view.tobytes() == obj
+    with pytest.raises(ValueError):
+        view.tobytes()
+
+
+def test_dunder_exporter():
+    obj = Exporter(b"abc")
+    with borrow_buffer(obj) as view:
+        obj.data[1] = ord("x")
+        assert view.tobytes() == b"axc"
+        assert obj.released == []
+    assert len(obj.released) == 1
+    assert as_buffer(obj).tobytes() == b"axc"
+
+
+def test_dunder_exporter_released_on_error():
+    obj = Exporter(b"abc")
+    with pytest.raises(RuntimeError):
+        with borrow_buffer(obj):
+            raise RuntimeError
+    assert len(obj.released) == 1
+
+
+@pytest.mark.parametrize("obj", ["abc", 1, [1, 2], object()])
+def test_unsupported(obj):
+    with pytest.raises(TypeError):
+        as_buffer(obj)
+    with pytest.raises(TypeError):
+        with borrow_buffer(obj):
+            pass
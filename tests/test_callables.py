@@ -0,0 +1,117 @@
+import inspect
+import sys
+from functools import partial
+
+import pytest
+
+from supportsx import CallKind, call_kind
+
+
+def sync(x):
+    return x
+
+
+def generator(x):
+    yield x
+
+
+async def coroutine(x):
+    return x
+
+
+async def async_generator(x):
+    yield x
+
+
+class Methods:
+    def sync(self):
+        pass
+
+    async def coroutine(self):
+        pass
+
+    @classmethod
+    async def class_coroutine(cls):
+        pass
+
+    @staticmethod
+    def static_generator():
+        yield
+
+
+class AsyncCall:
+    async def __call__(self):
+        pass
+
+
+class GeneratorCall:
+    def __call__(self):
+        yield
+
+
+class StaticCall:
+    @staticmethod
+    async def __call__():
+        pass
+
+
+class OptedOut(AsyncCall):
+    __call__ = None
+
+
+@pytest.mark.parametrize(
+    "func, kind",
+    [
+        (sync, CallKind.SYNC),
+        (lambda: None, CallKind.SYNC),
+        (generator, CallKind.GENERATOR),
+        (coroutine, CallKind.COROUTINE),
+        (async_generator, CallKind.ASYNC_GENERATOR),
+    ],
+)
+def test_functions(func, kind):
+    assert call_kind(func) == kind
+
+
+def test_methods_and_partials():
+    obj = Methods()
+    assert call_kind(obj.sync) == CallKind.SYNC
+    assert call_kind(obj.coroutine) == CallKind.COROUTINE
+    assert call_kind(Methods.class_coroutine) == CallKind.COROUTINE
+    assert call_kind(Methods.static_generator) == CallKind.GENERATOR
+    assert call_kind(partial(obj.coroutine)) == CallKind.COROUTINE
+    assert call_kind(partial(partial(async_generator), 1)) == (
+        CallKind.ASYNC_GENERATOR
+    )
+    assert call_kind(partial(AsyncCall())) == CallKind.COROUTINE
+
+
+def test_instances():
+    assert call_kind(AsyncCall()) == CallKind.COROUTINE
+    assert call_kind(GeneratorCall()) == CallKind.GENERATOR
+    assert call_kind(StaticCall()) == CallKind.COROUTINE
+    assert call_kind(AsyncCall().__call__) == CallKind.COROUTINE
+    assert call_kind(OptedOut()) == CallKind.NOT_CALLABLE
+    assert call_kind(1) == CallKind.NOT_CALLABLE
+    assert call_kind(object()) == CallKind.NOT_CALLABLE
+
+
+def test_classes_and_builtins():
+    assert call_kind(AsyncCall) == CallKind.SYNC
+    assert call_kind(OptedOut) == CallKind.SYNC
+    assert call_kind(int) == CallKind.SYNC
+    assert call_kind(len) == CallKind.SYNC
+    assert call_kind([].append) == CallKind.SYNC
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="requires markcoroutinefunction"
+)
+def test_marked_coroutine_functions():
+    def marked():
+        return coroutine(1)
+
+    inspect.markcoroutinefunction(marked)
+    assert call_kind(marked) == CallKind.COROUTINE
+    assert call_kind(partial(marked)) == CallKind.COROUTINE
+    assert call_kind(sync) == CallKind.SYNC
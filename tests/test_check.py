@@ -0,0 +1,48 @@
+import sys
+import threading
+
+import supportsx
+
+
+def test_none_opts_out():
+    class A:
+        def __iter__(self):
+            return iter(())
+
+    class B(A):
+        __iter__ = None
+
+    assert supportsx.implements(A, supportsx.iter)
+    assert not supportsx.implements(B, supportsx.iter)
+    assert not supportsx.supports(B(), supportsx.iter)
+
+
+def test_concurrent_resolution():
+    # every thread must see the same (positive) result while the members
+    # of a type are being resolved concurrently
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    results = []
+
+    def run(cls, barrier):
+        barrier.wait()
+        results.extend(
+            supportsx.implements(cls, supportsx.add) for _ in range(50)
+        )
+
+    try:
+        for _ in range(100):
+            C = type("C", (), {"__add__": lambda self, other: self})
+            barrier = threading.Barrier(4)
+            threads = [
+                threading.Thread(target=run, args=(C, barrier))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert all(results)
+    assert len(results) == 100 * 4 * 50
@@ -0,0 +1,59 @@
+import gc
+
+import supportsx
+
+
+def test_checker_caches_per_type():
+    check = supportsx.checker(supportsx.add, size=2)
+    assert check(1)
+    assert check(1.5)
+    assert not check(None)
+    assert check.megamorphic
+    # the least recently used type is evicted
+    assert check.types == (float, type(None))
+
+
+def test_checker_evicts_least_recently_used():
+    calls = []
+    check = supportsx.checker(
+        supportsx.add, size=2, on_megamorphic=calls.append
+    )
+    assert check(1)
+    assert check(1.5)
+    assert not check.megamorphic
+    assert check(2)
+    assert check("a")
+    assert check.types == (int, str)
+    assert calls == [check]
+    assert check([])
+    assert check(3)
+    assert check.types == (list, int)
+    # the callback is only called once per reset
+    assert calls == [check]
+    check.reset()
+    assert check.types == ()
+    assert not check.megamorphic
+
+
+def test_checker_does_not_cache_data_protocols():
+    check = supportsx.checker(supportsx.SupportsObjClass)
+
+    class OC:
+        pass
+
+    a = OC()
+    a.__objclass__ = int
+    assert check(a)
+    assert not check(OC())
+    assert check.types == ()
+
+
+def test_checker_holds_types_weakly():
+    check = supportsx.checker(supportsx.add)
+    cls = type("Dynamic", (), {"__add__": lambda self, other: self})
+    assert check(cls())
+    assert check.types == (cls,)
+    del cls
+    gc.collect()
+    assert check.types == ()
+    assert check(1)
@@ -0,0 +1,33 @@
+import array
+
+import pytest
+
+import supportsx
+
+
+@pytest.mark.parametrize("hint", [None, 0, 3, 10, 100])
+def test_collect_list(hint):
+    assert supportsx.collect_list(iter(range(10)), hint=hint) == list(
+        range(10)
+    )
+
+
+@pytest.mark.parametrize("hint", [None, 0, 3, 10, 100])
+def test_collect_bytearray(hint):
+    out = supportsx.collect_bytearray(
+        (i for i in range(10)), hint=hint
+    )
+    assert type(out) is bytearray
+    assert out == bytearray(range(10))
+
+
+def test_collect_bytearray_uses_length_hint():
+    assert supportsx.collect_bytearray(range(256)) == bytes(range(256))
+    with pytest.raises(ValueError):
+        supportsx.collect_bytearray([1, 256])
+
+
+@pytest.mark.parametrize("hint", [None, 0, 3, 10, 100])
+def test_collect_array(hint):
+    out = supportsx.collect_array((i for i in range(10)), "q", hint=hint)
+    assert out == array.array("q", range(10))
@@ -0,0 +1,71 @@
+import pytest
+
+import supportsx
+from supportsx import all_of, any_of
+
+
+class Both:
+    def __add__(self, other):
+        return self
+
+    def __lt__(self, other):
+        return False
+
+    def __iter__(self):
+        return iter(())
+
+
+def test_all_of_interned():
+    composite = all_of(supportsx.add, supportsx.lt)
+    assert all_of(supportsx.lt, supportsx.add) is composite
+    assert all_of(supportsx.add, supportsx.lt, supportsx.add) is composite
+    assert all_of(supportsx.add[int, int], supportsx.lt) is composite
+
+
+def test_all_of_flattened():
+    flat = all_of(supportsx.add, supportsx.lt, supportsx.iter)
+    nested = all_of(all_of(supportsx.add, supportsx.lt), supportsx.iter)
+    assert nested is flat
+    assert all_of(
+        all_of(supportsx.add, supportsx.lt),
+        all_of(supportsx.lt, supportsx.iter),
+    ) is flat
+
+
+def test_all_of_drops_redundant_bases():
+    assert all_of(supportsx.add) is supportsx.add
+    assert all_of(
+        supportsx.SupportsContextManager, supportsx.enter
+    ) is supportsx.SupportsContextManager
+
+
+def test_all_of_checks():
+    composite = all_of(supportsx.add, supportsx.lt, supportsx.iter)
+    assert isinstance(Both(), composite)
+    assert issubclass(Both, composite)
+    assert not isinstance(1, composite)
+    assert not issubclass(int, composite)
+    assert supportsx.implements(Both, composite)
+
+
+def test_any_of():
+    composite = any_of(supportsx.iter, supportsx.index)
+    assert any_of(supportsx.index, supportsx.iter, supportsx.iter) is (
+        composite
+    )
+    assert any_of(any_of(supportsx.iter), supportsx.index) is composite
+    assert any_of(supportsx.iter) is supportsx.iter
+    assert isinstance(1, composite)
+    assert isinstance([], composite)
+    assert not isinstance(1.5, composite)
+    assert issubclass(list, composite)
+    assert not issubclass(float, composite)
+
+
+def test_compose_rejects_non_protocols():
+    with pytest.raises(TypeError):
+        all_of(int, supportsx.add)
+    with pytest.raises(TypeError):
+        any_of(int, supportsx.add)
+    with pytest.raises(TypeError):
+        all_of()
@@ -0,0 +1,60 @@
+import array
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from supportsx import _collect, to_array
+
+
+class Index:
+    def __init__(self, value):
+        self.value = value
+
+    def __index__(self):
+        return self.value
+
+
+MIXED = [1, True, Decimal("2.5"), 3.75, Fraction(9, 2), Index(7)]
+
+
+def test_integral():
+    result = to_array(MIXED, "q")
+    assert result == array.array("q", [1, 1, 2, 3, 4, 7])
+
+
+def test_floating():
+    result = to_array(MIXED, "d")
+    assert result == array.array("d", [1.0, 1.0, 2.5, 3.75, 4.5, 7.0])
+
+
+def test_homogeneous():
+    assert to_array(range(5), "q") == array.array("q", range(5))
+    assert to_array([0.5, 1.5]) == array.array("d", [0.5, 1.5])
+    assert to_array([], "q") == array.array("q")
+
+
+@pytest.mark.parametrize("kind", ["q", "d"])
+def test_chunks(monkeypatch, kind):
+    monkeypatch.setattr(_collect, "_CHUNK", 4)
+    # homogeneous and mixed chunks, with and without a length hint
+    values = [1, 2, 3, 4, 5, True, Decimal(7), 8, 9.0]
+    expected = array.array(kind, [1, 2, 3, 4, 5, 1, 7, 8, 9])
+    assert to_array(values, kind) == expected
+    assert to_array(iter(values), kind) == expected
+    assert to_array((value for value in values), kind) == expected
+
+
+def test_unsupported_value():
+    with pytest.raises(TypeError):
+        to_array([1, "2"], "q")
+    with pytest.raises(TypeError):
+        to_array(["1.5"], "d")
+    with pytest.raises(TypeError):
+        to_array([object()], "q")
+
+
+@pytest.mark.parametrize("kind", ["u", "w", "x", "", "qq"])
+def test_unsupported_kind(kind):
+    with pytest.raises(ValueError):
+        to_array([1], kind)
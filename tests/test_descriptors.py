@@ -0,0 +1,84 @@
+import functools
+
+import supportsx
+from supportsx import DescriptorKind
+
+
+class SetOnly:
+    def __set__(self, instance, value):
+        pass
+
+
+class DeleteOnly:
+    def __delete__(self, instance):
+        pass
+
+
+class Base:
+    shadowed = property(lambda self: 1)
+    inherited = 1
+
+
+class Model(Base):
+    __slots__ = ("slot",)
+    shadowed = 2
+    setter = SetOnly()
+    deleter = DeleteOnly()
+    prop = property(lambda self: 1)
+    value = 3
+
+    def method(self):
+        pass
+
+    @classmethod
+    def factory(cls):
+        pass
+
+    @staticmethod
+    def helper():
+        pass
+
+
+class Cached:
+    @functools.cached_property
+    def size(self):
+        return 1
+
+
+def test_classify_descriptors():
+    kinds = supportsx.classify_descriptors(Model)
+    assert kinds["slot"] is DescriptorKind.DATA
+    assert kinds["prop"] is DescriptorKind.DATA
+    assert kinds["setter"] is DescriptorKind.DATA
+    assert kinds["deleter"] is DescriptorKind.DATA
+    assert kinds["method"] is DescriptorKind.NON_DATA
+    assert kinds["factory"] is DescriptorKind.NON_DATA
+    assert kinds["helper"] is DescriptorKind.NON_DATA
+    assert kinds["value"] is DescriptorKind.VALUE
+    assert kinds["inherited"] is DescriptorKind.VALUE
+    assert supportsx.classify_descriptors(Cached)["size"] is (
+        DescriptorKind.NON_DATA
+    )
+
+
+def test_classify_descriptors_mro_shadowing():
+    assert supportsx.classify_descriptors(Base)["shadowed"] is (
+        DescriptorKind.DATA
+    )
+    assert supportsx.classify_descriptors(Model)["shadowed"] is (
+        DescriptorKind.VALUE
+    )
+
+
+def test_classify_descriptors_cache():
+    class Dynamic:
+        attribute = 1
+
+    kinds = supportsx.classify_descriptors(Dynamic)
+    assert supportsx.classify_descriptors(Dynamic) is kinds
+    Dynamic.attribute = property(lambda self: 1)
+    assert supportsx.classify_descriptors(Dynamic) is kinds
+    supportsx.clear_cache(Dynamic)
+    updated = supportsx.classify_descriptors(Dynamic)
+    assert updated is not kinds
+    assert updated["attribute"] is DescriptorKind.DATA
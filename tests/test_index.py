@@ -0,0 +1,84 @@
+import asyncio
+import sys
+import textwrap
+
+import pytest
+
+import supportsx
+from supportsx import implementers
+
+PLUGIN = """
+class Outer:
+    class Inner:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            pass
+
+
+class Plain:
+    pass
+"""
+
+
+@pytest.fixture
+def plugin(tmp_path, monkeypatch):
+    """Import a fresh module after the index has been built."""
+    implementers(supportsx.u.actx_mngr)
+    name = f"plugin_{tmp_path.name}"
+    (tmp_path / f"{name}.py").write_text(textwrap.dedent(PLUGIN))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = __import__(name)
+    yield module
+    sys.modules.pop(name, None)
+
+
+def test_implementers():
+    found = implementers(supportsx.u.actx_mngr, ["asyncio.locks"])
+    assert asyncio.Lock in found
+    assert asyncio.Semaphore in found
+    assert all(cls.__module__ == "asyncio.locks" for cls in found)
+    # protocols are excluded
+    assert supportsx.u.actx_mngr not in implementers(
+        supportsx.u.actx_mngr
+    )
+
+
+def test_implementers_nested_classes(plugin):
+    found = implementers(supportsx.u.actx_mngr)
+    assert plugin.Outer.Inner in found
+    assert plugin.Outer not in found
+    assert implementers(supportsx.u.actx_mngr, [plugin]) == [
+        plugin.Outer.Inner
+    ]
+
+
+def test_implementers_new_subclasses_of_object():
+    implementers(supportsx.add)
+
+    class Late:
+        def __add__(self, other):
+            return self
+
+    assert Late in implementers(supportsx.add)
+
+
+def test_implementers_rescans_modules(plugin):
+    assert implementers(supportsx.add, [plugin]) == []
+
+    class Added:
+        def __add__(self, other):
+            return self
+
+    class Base:
+        pass
+
+    class Derived(Base):
+        def __add__(self, other):
+            return self
+
+    Added.__module__ = Derived.__module__ = plugin.__name__
+    plugin.Derived = Derived
+    found = implementers(supportsx.add, [plugin])
+    assert set(found) == {Added, Derived}
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+import supportsx
+
+_EAGER = {
+    "supportsx",
+    "supportsx._check",
+    "supportsx._reduce",
+    "supportsx._supports",
+}
+
+
+def _loaded(code):
+    """Get the supportsx modules loaded after running `code` in a fresh
+    interpreter.
+
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.dirname(os.path.dirname(supportsx.__file__))
+    output = subprocess.run(
+        [sys.executable, "-c", code + (
+            "\nimport sys\n"
+            "print(' '.join(m for m in sys.modules"
+            " if m.split('.')[0] == 'supportsx'))"
+        )],
+        capture_output=True, check=True, env=env, text=True,
+    ).stdout
+    return set(output.split())
+
+
+def test_import_is_lazy():
+    assert _loaded("import supportsx") == _EAGER
+
+
+def test_lazy_attribute_imports_only_its_module():
+    assert _loaded("import supportsx; supportsx.amerge") == (
+        _EAGER | {"supportsx._async"}
+    )
+
+
+def test_all_names_resolve():
+    for name in supportsx.__all__:
+        assert getattr(supportsx, name) is not None
+    assert set(supportsx.__all__) <= set(dir(supportsx))
+    assert supportsx.u.SupportsBitwiseOps is supportsx.SupportsBitwiseOps
@@ -0,0 +1,15 @@
+import supportsx
+
+
+def test_parallel_check():
+    items = [1, "a", 2.5, None, 3] * 100
+    expected = [supportsx.supports(item, supportsx.index) for item in items]
+    results = supportsx.parallel_check(
+        items, supportsx.index, workers=1, chunksize=64
+    )
+    assert list(results) == expected
+    unordered = supportsx.parallel_check(
+        iter(items), supportsx.index, workers=1, chunksize=64,
+        ordered=False,
+    )
+    assert sorted(unordered) == list(enumerate(expected))
@@ -0,0 +1,30 @@
+import io
+from typing import Protocol
+
+import supportsx
+
+
+def test_profiler_records_call_sites():
+    profiler = supportsx.Profiler()
+    with profiler:
+        for _ in range(3):
+            supportsx.supports(1, supportsx.add)
+        isinstance(1, supportsx.sub)
+    out = io.StringIO()
+    profiler.report(out, sort="count")
+    lines = out.getvalue().splitlines()
+    assert len(lines) == 3
+    assert lines[1].split()[0] == "3"
+    assert "SupportsAdd" in lines[1]
+    assert "SupportsSub" in lines[2]
+
+
+def test_profiler_restores_protocol_meta():
+    meta = type(Protocol)
+    names = ("__instancecheck__", "__subclasscheck__")
+    before = {name: meta.__dict__.get(name) for name in names}
+    with supportsx.Profiler():
+        assert all(
+            meta.__dict__.get(name) is not before[name] for name in names
+        )
+    assert {name: meta.__dict__.get(name) for name in names} == before
@@ -0,0 +1,49 @@
+import io
+import pickle
+import timeit
+from typing import Any
+
+import supportsx
+
+
+def _dumps_with_typing(obj):
+    """Pickle `obj` without the reducers registered by supportsx."""
+    out = io.BytesIO()
+    pickler = pickle.Pickler(out, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = {}
+    pickler.dump(obj)
+    return out.getvalue()
+
+
+def _loads_time(data):
+    return min(timeit.repeat(
+        lambda: pickle.loads(data), number=2000, repeat=5
+    ))
+
+
+def test_subscripted_protocols_round_trip():
+    for alias in (
+        supportsx.add[Any, int],
+        supportsx.iter[int],
+        supportsx.call[[int], str],
+    ):
+        assert pickle.loads(pickle.dumps(alias)) == alias
+    # cached by `typing`, so interned
+    alias = supportsx.add[Any, int]
+    assert pickle.loads(pickle.dumps(alias)) is alias
+
+
+def test_subscripted_protocols_are_smaller_and_faster():
+    alias = supportsx.add[Any, int]
+    data = pickle.dumps(alias, pickle.HIGHEST_PROTOCOL)
+    plain = _dumps_with_typing(alias)
+    assert len(data) < len(plain)
+    # generous, as timings are noisy
+    assert _loads_time(data) < 1.5 * _loads_time(plain)
+
+
+def test_composites_round_trip():
+    all_of = supportsx.all_of(supportsx.add, supportsx.sub)
+    any_of = supportsx.any_of(supportsx.add, supportsx.sub)
+    assert pickle.loads(pickle.dumps(all_of)) is all_of
+    assert pickle.loads(pickle.dumps(any_of)) is any_of
@@ -0,0 +1,26 @@
+import supportsx
+
+
+def test_schema_validates():
+    schema = supportsx.Schema(
+        {"id": supportsx.index, "points": [{"x": supportsx.float}]}
+    )
+    assert schema({"id": 1, "points": [{"x": 1.0}, {"x": 2}]})
+    assert not schema({"id": 1.5, "points": []})
+    assert not schema({"id": 1})
+    assert not schema({"id": 1, "points": [{}]})
+
+
+def test_schema_failures_in_document_order():
+    schema = supportsx.Schema(
+        {"a": {"x": supportsx.index}, "b": supportsx.index}
+    )
+    assert schema.failures({"a": {"x": "no"}}) == [
+        (("a", "x"), "does not support SupportsIndex"),
+        ((), "missing key 'b'"),
+    ]
+    assert schema.failures({"b": 1}) == [((), "missing key 'a'")]
+    assert schema.failures({"a": [], "b": None}) == [
+        (("a",), "expected a mapping"),
+        (("b",), "does not support SupportsIndex"),
+    ]
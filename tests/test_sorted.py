@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+import supportsx
+from supportsx import _sorted
+
+
+def test_sorted_index_matches_sorted_list(monkeypatch):
+    # small sublists, so that splitting and deletion of sublists is
+    # exercised
+    monkeypatch.setattr(_sorted, "_LOAD", 4)
+    rng = random.Random(0)
+    index = supportsx.SortedIndex()
+    expected = []
+    for _ in range(500):
+        value = rng.randrange(100)
+        if expected and rng.random() < 0.3:
+            value = rng.choice(expected)
+            index.remove(value)
+            expected.remove(value)
+        else:
+            index.add(value)
+            expected.append(value)
+        expected.sort()
+        assert list(index) == expected
+    assert len(index) == len(expected)
+    assert list(reversed(index)) == expected[::-1]
+    assert list(index.irange(10, 20)) == [
+        value for value in expected if 10 <= value <= 20
+    ]
+    assert list(index.irange(10, 20, inclusive=(False, False))) == [
+        value for value in expected if 10 < value < 20
+    ]
+
+
+def test_sorted_index_key():
+    index = supportsx.SortedIndex(["bb", "a", "ccc"], key=len)
+    index.add("dd")
+    assert list(index) == ["a", "bb", "dd", "ccc"]
+    assert "dd" in index
+    index.remove("bb")
+    assert list(index.irange(2, 3)) == ["dd", "ccc"]
+    with pytest.raises(ValueError):
+        index.remove("zz")
+
+
+def test_sorted_index_update_reuses_keys():
+    calls = 0
+
+    def key(value):
+        nonlocal calls
+        calls += 1
+        return -value
+
+    index = supportsx.SortedIndex(range(1000), key=key)
+    assert calls == 1000
+    calls = 0
+    # large enough to rebuild, which only computes the new keys
+    index.update(range(300))
+    assert calls == 300
+    assert list(index) == sorted(
+        [*range(1000), *range(300)], key=lambda value: -value
+    )
+    # equivalent values are kept in insertion order
+    index = supportsx.SortedIndex(["b", "a"], key=len)
+    index.update(["d", "c"])
+    assert list(index) == ["b", "a", "d", "c"]
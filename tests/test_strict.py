@@ -0,0 +1,101 @@
+import pytest
+
+import supportsx
+from supportsx import _check
+
+
+class RoundBoth:
+    def __round__(self, ndigits=None):
+        return 0
+
+
+class RoundNoDigits:
+    def __round__(self):
+        return 0
+
+
+class RoundDigitsOnly:
+    def __round__(self, ndigits):
+        return 0
+
+
+class PowBoth:
+    def __pow__(self, other, modulo=None):
+        return self
+
+
+class PowNoModulo:
+    def __pow__(self, other):
+        return self
+
+
+class StaticRound:
+    @staticmethod
+    def __round__(ndigits=None):
+        return 0
+
+
+class ClassRound:
+    @classmethod
+    def __round__(cls, ndigits=None):
+        return 0
+
+
+class StaticRoundNoDigits:
+    @staticmethod
+    def __round__():
+        return 0
+
+
+@pytest.mark.parametrize("cls, expected", [
+    (RoundBoth, True),
+    (RoundNoDigits, False),
+    (RoundDigitsOnly, False),
+    (StaticRound, True),
+    (ClassRound, True),
+    (StaticRoundNoDigits, False),
+    (int, True),
+    (float, True),
+])
+def test_strict_round(cls, expected):
+    assert supportsx.implements(cls, supportsx.round)
+    assert supportsx.implements(cls, supportsx.round, strict=True) is (
+        expected
+    )
+    assert supportsx.supports(cls(), supportsx.round, strict=True) is (
+        expected
+    )
+
+
+@pytest.mark.parametrize("cls, expected", [
+    (PowBoth, True),
+    (PowNoModulo, False),
+    (int, True),
+    (float, True),
+])
+def test_strict_pow(cls, expected):
+    assert supportsx.implements(cls, supportsx.pow)
+    assert supportsx.implements(cls, supportsx.pow, strict=True) is (
+        expected
+    )
+
+
+def test_arity_computed_once_per_function(monkeypatch):
+    calls = []
+    signature_arity = _check._signature_arity
+
+    def counting(func, bound):
+        calls.append(func)
+        return signature_arity(func, bound)
+
+    monkeypatch.setattr(_check, "_signature_arity", counting)
+
+    def __round__(self, ndigits=None):
+        return 0
+
+    first = type("First", (), {"__round__": __round__})
+    second = type("Second", (), {"__round__": __round__})
+    for cls in (first, second, first):
+        supportsx.clear_cache(cls)
+        assert supportsx.implements(cls, supportsx.round, strict=True)
+    assert calls.count(__round__) == 1
@@ -0,0 +1,48 @@
+from typing import Protocol, runtime_checkable
+
+from supportsx import SupportsMatchArgs, SupportsObjClass
+
+
+class Matched:
+    __match_args__ = ("a",)
+
+
+class Unmatched:
+    pass
+
+
+def test_data_protocol_issubclass():
+    assert issubclass(Matched, SupportsMatchArgs)
+    assert not issubclass(Unmatched, SupportsMatchArgs)
+    assert issubclass(type(str.join), SupportsObjClass)
+    assert not issubclass(int, SupportsObjClass)
+
+
+def test_data_protocol_subprotocols():
+    @runtime_checkable
+    class P2(SupportsMatchArgs, Protocol):
+        pass
+
+    @runtime_checkable
+    class P3(P2, SupportsObjClass, Protocol):
+        def method(self) -> None: ...
+
+    class Both:
+        __match_args__ = ()
+        __objclass__ = int
+
+        def method(self) -> None: ...
+
+    assert issubclass(Matched, P2)
+    assert not issubclass(Unmatched, P2)
+    assert issubclass(Both, P3)
+    assert not issubclass(Matched, P3)
+    assert isinstance(Both(), P3)
+
+
+def test_data_protocol_concrete_subclass():
+    class Concrete(SupportsMatchArgs):
+        __match_args__ = ()
+
+    assert issubclass(Concrete, SupportsMatchArgs)
+    assert isinstance(Concrete(), SupportsMatchArgs)
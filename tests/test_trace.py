@@ -0,0 +1,56 @@
+import sys
+
+import pytest
+
+import supportsx
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="requires sys.monitoring"
+)
+def test_tracer_counts_checks():
+    tracer = supportsx.Tracer()
+    with tracer:
+        assert tracer.active
+        supportsx.supports(1, supportsx.add)
+        supportsx.implements(str, supportsx.add)
+    assert not tracer.active
+    supportsx.supports(1, supportsx.add)
+    assert tracer.counts() == {
+        (supportsx.add, int): 1, (supportsx.add, str): 1,
+    }
+    assert tracer.by_protocol() == {supportsx.add: 2}
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 12), reason="sys.monitoring is available"
+)
+def test_tracer_requires_monitoring():
+    with pytest.raises(RuntimeError):
+        supportsx.Tracer().start()
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="requires sys.monitoring"
+)
+def test_tracer_counts_isinstance_and_issubclass():
+    import typing
+
+    tracer = supportsx.Tracer()
+    composite = supportsx.all_of(supportsx.add, supportsx.lt)
+    with tracer:
+        assert isinstance(1, supportsx.add)
+        assert not isinstance(None, supportsx.SupportsContextManager)
+        assert issubclass(str, supportsx.add)
+        assert issubclass(list, supportsx.SupportsIter)
+        # not a supportsx protocol
+        assert isinstance(1, typing.SupportsInt)
+        # counted once, through `supports`
+        assert isinstance(1, composite)
+    assert tracer.counts() == {
+        (supportsx.add, int): 1,
+        (supportsx.SupportsContextManager, type(None)): 1,
+        (supportsx.add, str): 1,
+        (supportsx.SupportsIter, list): 1,
+        (composite, int): 1,
+    }
@@ -0,0 +1,135 @@
+import pytest
+
+from supportsx import SequenceView, _views, clear_cache, iter_reversed, view
+from supportsx._check import _capabilities_of
+
+
+DATA = list(range(20))
+
+
+def test_view():
+    v = view(DATA)
+    assert isinstance(v, SequenceView)
+    assert list(v) == DATA
+    assert len(v) == 20
+    assert list(view(DATA, slice(3, 9, 2))) == DATA[3:9:2]
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        (slice(2, 18), slice(3, None, 2)),
+        (slice(None, None, 3), slice(1, -1)),
+        (slice(-5, None), slice(None, None, -1)),
+        (slice(None, None, -1), slice(2, 12, 3)),
+        (slice(15, 2, -2), slice(None, None, -2)),
+        (slice(5, 5), slice(None)),
+        (slice(100, None), slice(-100, 100)),
+    ],
+)
+def test_chained_slicing(first, second):
+    expected = DATA[first][second]
+    chained = view(DATA, first)[second]
+    assert list(chained) == expected
+    assert len(chained) == len(expected)
+    assert list(reversed(chained)) == expected[::-1]
+    # views of views refer directly to the underlying sequence
+    assert view(view(DATA, first), second)._seq is DATA
+    assert list(view(view(DATA, first), second)) == expected
+
+
+def test_indexing():
+    v = view(DATA, slice(10, 2, -3))
+    expected = DATA[10:2:-3]
+    for i in range(-len(expected), len(expected)):
+        assert v[i] == expected[i]
+    for i in (len(expected), -len(expected) - 1, 100):
+        with pytest.raises(IndexError):
+            v[i]
+    with pytest.raises(IndexError):
+        view(DATA, slice(5, 5))[0]
+
+
+def test_does_not_copy():
+    data = list(range(5))
+    v = view(data, slice(1, 4))
+    data[2] = "x"
+    assert list(v) == [1, "x", 3]
+
+
+@pytest.mark.parametrize("key", [3, "a", None, (1, 2)])
+def test_non_slice_keys(key):
+    with pytest.raises(TypeError):
+        view(DATA, key)
+    with pytest.raises(TypeError):
+        view(view(DATA), key)
+    if not isinstance(key, int):
+        with pytest.raises(TypeError):
+            view(DATA)[key]
+
+
+class Reversible:
+    def __init__(self):
+        self.calls = 0
+
+    def __reversed__(self):
+        self.calls += 1
+        return iter("cba")
+
+
+class Indexed:
+    """A mapping keyed by index."""
+
+    def __init__(self, data):
+        self.data = dict(enumerate(data))
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def keys(self):
+        return self.data.keys()
+
+
+class OptedOut(Indexed):
+    __reversed__ = None
+
+
+def test_iter_reversed_dunder():
+    obj = Reversible()
+    assert list(iter_reversed(obj)) == ["c", "b", "a"]
+    assert obj.calls == 1
+    assert list(iter_reversed([1, 2, 3])) == [3, 2, 1]
+    assert list(iter_reversed({"a": 1, "b": 2})) == ["b", "a"]
+    assert list(iter_reversed(view(DATA, slice(2, 6)))) == [5, 4, 3, 2]
+
+
+def test_iter_reversed_indexed():
+    obj = Indexed("abc")
+    assert list(iter_reversed(obj)) == ["c", "b", "a"]
+    assert list(iter_reversed(Indexed(""))) == []
+
+
+@pytest.mark.parametrize("obj", [OptedOut("abc"), {1, 2}, 1, object()])
+def test_iter_reversed_unsupported(obj):
+    with pytest.raises(TypeError):
+        iter_reversed(obj)
+
+
+def test_iter_reversed_strategy_cached():
+    class Lazy(Indexed):
+        pass
+
+    obj = Lazy("abc")
+    assert _capabilities_of(Lazy).reverse is None
+    assert list(iter_reversed(obj)) == ["c", "b", "a"]
+    strategy = _capabilities_of(Lazy).reverse
+    assert strategy == _views._INDEXED
+    # the strategy is not re-resolved per call
+    Lazy.__reversed__ = lambda self: iter("x")
+    assert list(iter_reversed(obj)) == ["c", "b", "a"]
+    clear_cache()
+    assert list(iter_reversed(obj)) == ["x"]
+    assert _capabilities_of(Lazy).reverse == _views._REVERSED